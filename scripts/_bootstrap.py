@@ -0,0 +1,30 @@
+"""
+Shared bootstrap for the scripts/ entrypoints.
+
+Usage (from any script in this folder):
+    from _bootstrap import ROOT
+
+- Puts the repo root on sys.path so `import src...` works when run from /scripts (via _paths)
+- Loads .env once per interpreter: the module body runs on first import only (no secrets printed)
+- DEBUG (VERIFY_DEBUG=1) enables pretty-printed dumps; default is one compact JSON line
+"""
+import json
+import os
+
+from _paths import ROOT
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv(ROOT / ".env")
+except Exception:
+    pass
+
+DEBUG = bool(os.getenv("VERIFY_DEBUG"))
+
+
+def dump(obj) -> None:
+    if DEBUG:
+        from pprint import pprint
+        pprint(obj)
+    else:
+        print(json.dumps(obj, default=str))
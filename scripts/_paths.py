@@ -0,0 +1,11 @@
+"""
+Repo-root resolution for the scripts/ entrypoints (resolved once per interpreter).
+
+    from _paths import ROOT
+"""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
@@ -0,0 +1,14 @@
+"""
+Parse-once cache for contract JSON schemas used by the verify scripts.
+
+Paths are repo-root relative (e.g. "architecture/schemas/domain/order_draft.v0.6.json").
+"""
+import json
+from functools import lru_cache
+
+from _paths import ROOT
+
+
+@lru_cache(maxsize=None)
+def load_schema(path: str) -> dict:
+    return json.loads((ROOT / path).read_text(encoding="utf-8"))
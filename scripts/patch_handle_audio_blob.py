@@ -1,53 +1,78 @@
 from __future__ import annotations
-from pathlib import Path
+import hashlib
 import re
 
-ROOT = Path(__file__).resolve().parents[1]
+from _paths import ROOT
+
+IMPORT_RE = re.compile(rb"^(?:import |from )")
+DEF_RE = re.compile(rb"^(\s*)async def handle_audio_blob\s*\(")
+TYPING_OPT_RE = re.compile(rb"^from typing import .*Optional")
+
+# STT env knobs are read once at import (not per audio blob)
+STT_CONSTANTS = (
+    b'_STT_FILENAME = (os.getenv("OPENAI_AUDIO_FILENAME_HINT", "audio.webm").strip() or "audio.webm")\n'
+    b'_STT_EXT = _STT_FILENAME.rsplit(".", 1)[-1] or "bin"\n'
+    b'_STT_MODEL = os.getenv("OPENAI_STT_MODEL", "whisper-1")'
+)
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
 p = ROOT / "src/agent/voice_agent.py"
-src = p.read_text(encoding="utf-8").splitlines(True)  # keep line endings
-
-def ensure_import(lines: list[str], import_stmt: str) -> list[str]:
-    # If already present, do nothing
-    if any(import_stmt in ln for ln in lines):
-        return lines
-
-    # Insert after the last import/from block near the top
-    insert_at = 0
-    for i, ln in enumerate(lines[:200]):
-        if ln.startswith("import ") or ln.startswith("from "):
-            insert_at = i + 1
-
-    lines.insert(insert_at, import_stmt + "\n")
-    return lines
-
-# Ensure basic imports used by the new function exist
-src = ensure_import(src, "import os")
-src = ensure_import(src, "import asyncio")
-# Optional may be imported as `from typing import Optional, ...`
-if not any(re.match(r"^from typing import .*Optional", ln) for ln in src):
-    src = ensure_import(src, "from typing import Optional")
-
-# Find start of handle_audio_blob
+raw = p.read_bytes()
+src = raw.splitlines(keepends=True)  # bytes lines, keep line endings
+
+# Single pass: last top-level import (first 200 lines), which imports/constants
+# already exist, and where handle_audio_blob starts.
+insert_at = 0
+has_os = has_asyncio = has_optional = has_constants = False
 start = None
+indent_b = b""
 for i, ln in enumerate(src):
-    if re.match(r"^\s*async def handle_audio_blob\s*\(", ln):
-        start = i
-        break
+    if i < 200 and IMPORT_RE.match(ln):
+        insert_at = i + 1
+        stripped = ln.rstrip()
+        if stripped == b"import os":
+            has_os = True
+        elif stripped == b"import asyncio":
+            has_asyncio = True
+        elif TYPING_OPT_RE.match(ln):
+            has_optional = True
+    elif ln.startswith(b"_STT_FILENAME = "):
+        has_constants = True
+    elif start is None:
+        m = DEF_RE.match(ln)
+        if m:
+            start = i
+            indent_b = m.group(1)
+
 if start is None:
     raise SystemExit("Could not find: async def handle_audio_blob(")
 
-# Determine indentation of the function line
-indent = re.match(r"^(\s*)", src[start]).group(1)
+# Ensure basic imports used by the new function exist (+ the STT constants)
+missing = []
+if not has_os:
+    missing.append(b"import os\n")
+if not has_asyncio:
+    missing.append(b"import asyncio\n")
+if not has_optional:
+    missing.append(b"from typing import Optional\n")
+if not has_constants:
+    missing.append(STT_CONSTANTS + b"\n")
+if missing:
+    src[insert_at:insert_at] = missing
+    if start >= insert_at:
+        start += len(missing)
 
 # Find end: next 'async def' at same indentation (or EOF)
-end = None
+DEF_AT_INDENT = re.compile(rb"^" + re.escape(indent_b) + rb"async def\s+\w+\s*\(")
+end = len(src)
 for j in range(start + 1, len(src)):
-    if src[j].startswith(indent) and re.match(rf"^{re.escape(indent)}async def\s+\w+\s*\(", src[j]):
+    if DEF_AT_INDENT.match(src[j]):
         end = j
         break
-if end is None:
-    end = len(src)
 
+indent = indent_b.decode("utf-8")
 new_block = f"""{indent}async def handle_audio_blob(self, session_id: str, audio: bytes) -> Optional[str]:
 {indent}    \"\"\"
 {indent}    Receives a binary audio blob from the websocket (typically MediaRecorder chunks),
@@ -64,22 +89,17 @@ new_block = f"""{indent}async def handle_audio_blob(self, session_id: str, audio
 {indent}        # Dump incoming audio so we can confirm container/codec via `file logs/audio_*.webm`
 {indent}        try:
 {indent}            from src.utils.audio_debug import dump_audio_blob
-{indent}            ext = (os.getenv("OPENAI_AUDIO_FILENAME_HINT", "audio.webm").split(".")[-1] or "bin")
-{indent}            dump_audio_blob(session_id, audio, ext=ext)
+{indent}            dump_audio_blob(session_id, audio, ext=_STT_EXT)
 {indent}        except Exception:
 {indent}            pass
 
 {indent}        import io
 {indent}        audio_file = io.BytesIO(audio)
-
-{indent}        filename = os.getenv("OPENAI_AUDIO_FILENAME_HINT", "audio.webm").strip() or "audio.webm"
-{indent}        audio_file.name = filename
-
-{indent}        model = os.getenv("OPENAI_STT_MODEL", "whisper-1")
+{indent}        audio_file.name = _STT_FILENAME
 
 {indent}        resp = await asyncio.to_thread(
 {indent}            lambda: self.openai.audio.transcriptions.create(
-{indent}                model=model,
+{indent}                model=_STT_MODEL,
 {indent}                file=audio_file,
 {indent}            )
 {indent}        )
@@ -91,13 +111,22 @@ new_block = f"""{indent}async def handle_audio_blob(self, session_id: str, audio
 {indent}        return None
 """
 
-# Backup
+new_block_bytes = new_block.encode("utf-8")
+
+# Idempotent: nothing to insert and the current block already matches -> no writes (no .bak either)
+current_block = b"".join(src[start:end])
+if not missing and _digest(current_block) == _digest(new_block_bytes):
+    print("✅ handle_audio_blob() already patched")
+    print("File:", p)
+    raise SystemExit(0)
+
+# Backup (original bytes as read)
 bak = p.with_suffix(".py.bak")
-bak.write_text("".join(src), encoding="utf-8")
+bak.write_bytes(raw)
 
 # Replace block
-out_lines = src[:start] + [new_block] + src[end:]
-p.write_text("".join(out_lines), encoding="utf-8")
+out_lines = src[:start] + [new_block_bytes] + src[end:]
+p.write_bytes(b"".join(out_lines))
 
 print("✅ Patched handle_audio_blob()")
 print("Backup:", bak)
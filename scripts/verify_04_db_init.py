@@ -1,14 +1,9 @@
 import os
-import sys
 import asyncio
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Ensure repo root is on sys.path so "import src.*" works
-ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT))
-
-load_dotenv()
+# Ensure repo root is on sys.path so "import src.*" works (+ loads .env once)
+from _bootstrap import ROOT
 
 print("==[verify_04_db_init]==")
 print("ROOT:", ROOT)
@@ -26,16 +21,29 @@ print("Has pool attr:", hasattr(db, "pool"))
 print("pool is None:", getattr(db, "pool", None) is None)
 print()
 
-async def try_methods():
-    candidates = [
-        "connect",
-        "init",
-        "init_pool",
-        "initialize",
-        "startup",
-        "open",
-        "create_pool",
-    ]
+# Resolved method names are cached after the first success so repeat runs
+# call exactly one method (no speculative create_pool() etc.)
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+INIT_CACHE = CACHE_DIR / "db_init_method"
+CLOSE_CACHE = CACHE_DIR / "db_close_method"
+
+def read_cached(path: Path):
+    try:
+        return path.read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+def write_cached(path: Path, name: str) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(name, encoding="utf-8")
+    except OSError:
+        pass
+
+async def call_first(candidates, cache_path: Path):
+    cached = read_cached(cache_path)
+    if cached in candidates:
+        candidates = [cached] + [n for n in candidates if n != cached]
     for name in candidates:
         fn = getattr(db, name, None)
         if fn and callable(fn):
@@ -45,11 +53,25 @@ async def try_methods():
                 if asyncio.iscoroutine(res):
                     await res
                 print(f"✅ db.{name}() succeeded")
+                if name != cached:
+                    write_cached(cache_path, name)
                 return name
             except Exception as e:
                 print(f"❌ db.{name}() failed: {type(e).__name__}: {e}")
     return None
 
+async def try_methods():
+    candidates = [
+        "connect",
+        "init",
+        "init_pool",
+        "initialize",
+        "startup",
+        "open",
+        "create_pool",
+    ]
+    return await call_first(candidates, INIT_CACHE)
+
 async def test_query():
     if not hasattr(db, "get_menu_items"):
         print("⚠️ db.get_menu_items not found")
@@ -63,18 +85,7 @@ async def test_query():
         print(f"❌ Query failed: {type(e).__name__}: {e}")
 
 async def try_close():
-    for name in ["close", "shutdown", "dispose"]:
-        fn = getattr(db, name, None)
-        if fn and callable(fn):
-            print(f"▶ Trying db.{name}()")
-            try:
-                res = fn()
-                if asyncio.iscoroutine(res):
-                    await res
-                print(f"✅ db.{name}() succeeded")
-                return
-            except Exception as e:
-                print(f"❌ db.{name}() failed: {type(e).__name__}: {e}")
+    return await call_first(["close", "shutdown", "dispose"], CLOSE_CACHE)
 
 async def main():
     method = await try_methods()
@@ -1,18 +1,9 @@
 import asyncio
 import os
-import sys
-from pathlib import Path
+from collections import defaultdict
 
-# Ensure repo root is on sys.path so `import src...` works when run from /scripts
-ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT))
-
-# Load .env (no secrets printed)
-try:
-    from dotenv import load_dotenv
-    load_dotenv(ROOT / ".env")
-except Exception:
-    pass
+# Ensure repo root is on sys.path + load .env once (no secrets printed)
+from _bootstrap import ROOT
 
 from src.db.database import db
 
@@ -23,46 +14,52 @@ async def main():
     print("ROOT:", ROOT)
     print("DATABASE_URL set:", bool(os.getenv("DATABASE_URL")))
 
-    await db.connect()
+    con = await db.single_connect()
     try:
-        async with db.pool.acquire() as con:
-            rows = await con.fetch("""
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = 'public'
-                ORDER BY table_name
-            """)
-            tables = [r["table_name"] for r in rows]
-            print("\n-- tables (public) --")
-            print(", ".join(tables))
+        rows = await con.fetch("""
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_schema = 'public'
+            ORDER BY table_name
+        """)
+        # All target columns in one round-trip
+        col_rows = await con.fetch("""
+            SELECT table_name, column_name, data_type, is_nullable, ordinal_position
+            FROM information_schema.columns
+            WHERE table_schema='public' AND table_name = ANY($1::text[])
+            ORDER BY table_name, ordinal_position
+        """, TARGET_TABLES)
+        tables = [r["table_name"] for r in rows]
+        print("\n-- tables (public) --")
+        print(", ".join(tables))
+
+        cols_by_table = defaultdict(list)
+        for c in col_rows:
+            cols_by_table[c["table_name"]].append(c)
 
-            for t in TARGET_TABLES:
-                print(f"\n-- columns: {t} --")
-                if t not in tables:
-                    print("MISSING TABLE")
-                    continue
-                cols = await con.fetch("""
-                    SELECT column_name, data_type, is_nullable
-                    FROM information_schema.columns
-                    WHERE table_schema='public' AND table_name=$1
-                    ORDER BY ordinal_position
-                """, t)
-                for c in cols:
-                    print(f"{c['column_name']:24} {c['data_type']:18} nullable={c['is_nullable']}")
+        for t in TARGET_TABLES:
+            print(f"\n-- columns: {t} --")
+            if t not in tables:
+                print("MISSING TABLE")
+                continue
+            for c in cols_by_table[t]:
+                print(f"{c['column_name']:24} {c['data_type']:18} nullable={c['is_nullable']}")
 
-            if "menu_items" in tables:
-                sample = await con.fetchrow("SELECT * FROM menu_items LIMIT 1")
-                print("\n-- sample menu_items keys --")
-                if sample:
-                    print(list(sample.keys()))
-                    print("\n-- sample menu_items row (first ~20 fields) --")
-                    d = dict(sample)
-                    for k in list(d.keys())[:20]:
-                        print(f"{k:24} = {d[k]}")
-                else:
-                    print("menu_items empty")
+        if "menu_items" in tables:
+            # Column names are already known: project only the ~20 fields we print
+            menu_cols = [c["column_name"] for c in cols_by_table["menu_items"]]
+            col_list = ", ".join('"' + c.replace('"', '""') + '"' for c in menu_cols[:20])
+            sample = await con.fetchrow(f"SELECT {col_list} FROM menu_items LIMIT 1")
+            print("\n-- sample menu_items keys --")
+            if sample:
+                print(menu_cols)
+                print("\n-- sample menu_items row (first ~20 fields) --")
+                for k, v in sample.items():
+                    print(f"{k:24} = {v}")
+            else:
+                print("menu_items empty")
     finally:
-        await db.close()
+        await con.close()
 
     print("\n==[end verify_06_db_schema]==")
 
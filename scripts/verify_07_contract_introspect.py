@@ -1,14 +1,14 @@
-import json
-import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT))
+from _schema_cache import load_schema
 
-def show(schema_path: str):
-    p = ROOT / schema_path
-    s = json.loads(p.read_text(encoding="utf-8"))
+SCHEMAS = [
+    "architecture/schemas/domain/order_draft.v0.6.json",
+    "architecture/schemas/domain/order_result.v0.6.json",
+    "architecture/schemas/tools/create_pos_order.v0.6.json",
+]
 
+def show(schema_path: str, s: dict):
     print(f"\n== {schema_path} ==")
     print("title:", s.get("title"))
     print("type:", s.get("type"))
@@ -17,6 +17,9 @@ def show(schema_path: str):
     if "$defs" in s:
         print("$defs:", list(s["$defs"].keys()))
 
-show("architecture/schemas/domain/order_draft.v0.6.json")
-show("architecture/schemas/domain/order_result.v0.6.json")
-show("architecture/schemas/tools/create_pos_order.v0.6.json")
+# Read + parse in parallel; print in stable order
+with ThreadPoolExecutor(max_workers=len(SCHEMAS)) as ex:
+    loaded = list(ex.map(load_schema, SCHEMAS))
+
+for path, schema in zip(SCHEMAS, loaded):
+    show(path, schema)
@@ -1,85 +1,87 @@
 import asyncio
-import os
-import sys
-from pathlib import Path
-from pprint import pprint
 from datetime import datetime, timezone
 
-ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT))
-
-try:
-    from dotenv import load_dotenv
-    load_dotenv(ROOT / ".env")
-except Exception:
-    pass
+from _bootstrap import ROOT, dump  # noqa: F401  (sys.path + .env)
 
 from src.db.database import db
 
 async def main():
     print("==[verify_09_create_pos_order_smoke]==")
-    await db.connect()
+    con = await db.single_connect()
     try:
-        async with db.pool.acquire() as con:
-            # 1) Get tenant UUID (as string)
-            t = await con.fetchrow("SELECT tenant_id, name FROM tenants LIMIT 1")
-            tenant_id = str(t["tenant_id"])
-            print("tenant:", t["name"], tenant_id)
+        # 1) Get tenant UUID (as string)
+        t = await con.fetchrow("SELECT tenant_id, name FROM tenants LIMIT 1")
+        tenant_id = str(t["tenant_id"])
+        print("tenant:", t["name"], tenant_id)
 
-            # 2) Pick a menu item that exists
-            mi = await con.fetchrow("""
-                SELECT item_id, name_en, price_delivery
-                FROM menu_items
-                ORDER BY item_id
-                LIMIT 1
-            """)
-            print("menu_item:", mi["item_id"], mi["name_en"], float(mi["price_delivery"]))
+        # 2) Pick a menu item that exists
+        mi = await con.fetchrow("""
+            SELECT item_id, name_en, price_delivery::float8 AS price
+            FROM menu_items
+            ORDER BY item_id
+            LIMIT 1
+        """)
+        print("menu_item:", mi["item_id"], mi["name_en"], mi["price"])
 
-            # 3) Build a minimal OrderDraft that matches schema intent
-            order_draft = {
-                "tenant_id": tenant_id,
-                "location_id": None,
-                "session_id": "sess_smoke_001",
-                "fulfillment_type": "pickup",
-                "items": [
-                    {
-                        "item_id": mi["item_id"],
-                        "name": mi["name_en"] or mi["item_id"],
-                        "quantity": 1,
-                        "unit_price": {"amount": float(mi["price_delivery"]), "currency": "EUR"},
-                        "modifiers": [],
-                        "notes": None,
-                    }
-                ],
-                "idempotency_key": "smoke-1",
-            }
+        # 3) Build a minimal OrderDraft that matches schema intent
+        order_draft = {
+            "tenant_id": tenant_id,
+            "location_id": None,
+            "session_id": "sess_smoke_001",
+            "fulfillment_type": "pickup",
+            "items": [
+                {
+                    "item_id": mi["item_id"],
+                    "name": mi["name_en"] or mi["item_id"],
+                    "quantity": 1,
+                    "unit_price": {"amount": mi["price"], "currency": "EUR"},
+                    "modifiers": [],
+                    "notes": None,
+                }
+            ],
+            "idempotency_key": "smoke-1",
+        }
 
-            print("\n-- order_draft preview --")
-            pprint(order_draft)
+        print("\n-- order_draft preview --")
+        dump(order_draft)
 
-            # 4) Just verify DB schema can accept tenant_id + session_id conventions
-            #    We'll insert a bare-min order directly (not via agent) as a DB smoke test
-            customer_id = await con.fetchval(
-                "INSERT INTO customers (tenant_id, name, phone) VALUES ($1, $2, $3) RETURNING customer_id",
-                tenant_id, "Smoke Customer", "sess_smoke_001"
-            )
-            order_id = await con.fetchval("""
-                INSERT INTO orders (tenant_id, customer_id, order_type, total_amount, session_id, order_status, created_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
-                RETURNING order_id
-            """, tenant_id, customer_id, "PICKUP", 0, "sess_smoke_001", "NEW", datetime.now(timezone.utc))
+        # 4) Just verify DB schema can accept tenant_id + session_id conventions
+        #    We'll insert a bare-min order directly (not via agent) as a DB smoke test.
+        #    One transaction; total computed upfront so no trailing UPDATE.
+        # (item_id, quantity, unit_price, customizations)
+        line_items = [
+            (mi["item_id"], 1, mi["price"], None),
+        ]
+        total_amount = sum(qty * price for _, qty, price, _ in line_items)
 
-            await con.execute("""
-                INSERT INTO order_items (tenant_id, order_id, item_id, quantity, price_at_order, customizations)
-                VALUES ($1, $2, $3, $4, $5, $6::jsonb)
-            """, tenant_id, order_id, mi["item_id"], 1, float(mi["price_delivery"]), None)
+        # Prepared statements: parsed/planned once, rows sent as binary parameters
+        ins_customer = await con.prepare(
+            "INSERT INTO customers (tenant_id, name, phone) VALUES ($1, $2, $3) RETURNING customer_id"
+        )
+        ins_order = await con.prepare("""
+            INSERT INTO orders (tenant_id, customer_id, order_type, total_amount, session_id, order_status, created_at)
+            VALUES ($1, $2, $3, $4, $5, $6, $7)
+            RETURNING order_id
+        """)
+        ins_item = await con.prepare("""
+            INSERT INTO order_items (tenant_id, order_id, item_id, quantity, price_at_order, customizations)
+            VALUES ($1, $2, $3, $4, $5, $6::jsonb)
+        """)
 
-            await con.execute("UPDATE orders SET total_amount=$1 WHERE order_id=$2", float(mi["price_delivery"]), order_id)
+        async with con.transaction():
+            customer_id = await ins_customer.fetchval(tenant_id, "Smoke Customer", "sess_smoke_001")
+            order_id = await ins_order.fetchval(
+                tenant_id, customer_id, "PICKUP", total_amount, "sess_smoke_001", "NEW", datetime.now(timezone.utc)
+            )
+            await ins_item.executemany([
+                (tenant_id, order_id, item_id, qty, qty * price, cust)
+                for item_id, qty, price, cust in line_items
+            ])
 
-            print("\n✅ DB insert smoke OK. order_id:", order_id)
+        print("\n✅ DB insert smoke OK. order_id:", order_id)
 
     finally:
-        await db.close()
+        await con.close()
 
     print("\n==[end verify_09_create_pos_order_smoke]==")
 
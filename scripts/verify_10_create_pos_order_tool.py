@@ -1,17 +1,6 @@
 import asyncio
-import os
-import sys
-from pathlib import Path
-from pprint import pprint
 
-ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT))
-
-try:
-    from dotenv import load_dotenv
-    load_dotenv(ROOT / ".env")
-except Exception:
-    pass
+from _bootstrap import ROOT, dump  # noqa: F401  (sys.path + .env)
 
 from src.db.database import db
 from src.agent.voice_agent_with_db import VoiceAgent
@@ -19,21 +8,25 @@ from src.api.contract_validate import validate_payload
 
 async def main():
     print("==[verify_10_create_pos_order_tool]==")
+    db.configure_pool(min_size=1, max_size=2)
     await db.connect()
 
-    async with db.pool.acquire() as con:
-        t = await con.fetchrow("SELECT tenant_id, name FROM tenants LIMIT 1")
-        tenant_id = str(t["tenant_id"])
-        print("tenant:", t["name"], tenant_id)
-
-        mi = await con.fetchrow("""
-            SELECT item_id, name_en, price_delivery
+    # Agent construction (client setup) overlaps the two DB reads.
+    # Pool-level fetchrow acquires its own connection, so both reads run concurrently.
+    agent_task = asyncio.create_task(asyncio.to_thread(VoiceAgent))
+    t, mi = await asyncio.gather(
+        db.pool.fetchrow("SELECT tenant_id, name FROM tenants LIMIT 1"),
+        db.pool.fetchrow("""
+            SELECT item_id, name_en, price_delivery::float8 AS price
             FROM menu_items
             ORDER BY item_id
             LIMIT 1
-        """)
+        """),
+    )
+    tenant_id = str(t["tenant_id"])
+    print("tenant:", t["name"], tenant_id)
 
-    agent = VoiceAgent()
+    agent = await agent_task
 
     order_draft = {
         "tenant_id": tenant_id,
@@ -45,7 +38,7 @@ async def main():
                 "item_id": mi["item_id"],
                 "name": mi["name_en"] or mi["item_id"],
                 "quantity": 2,
-                "unit_price": {"amount": float(mi["price_delivery"]), "currency": "EUR"},
+                "unit_price": {"amount": mi["price"], "currency": "EUR"},
                 "modifiers": [],
                 "notes": None,
             }
@@ -60,7 +53,7 @@ async def main():
     result = await agent.create_pos_order(order_draft)
 
     print("\n-- result --")
-    pprint(result)
+    dump(result)
 
     print("\n-- validating output schema --")
     validate_payload("domain/order_result.v0.6.json", result)
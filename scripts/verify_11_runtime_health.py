@@ -1,16 +1,21 @@
 import os
-import sys
 import json
 import time
-from pathlib import Path
-import urllib.request
+import http.client
 
-ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT))
+from _bootstrap import ROOT
 
-def http_json(url: str):
-    with urllib.request.urlopen(url, timeout=3) as r:
-        return json.loads(r.read().decode("utf-8"))
+BACKEND_HOST = "127.0.0.1"
+BACKEND_PORT = 8000
+
+def http_json(conn: http.client.HTTPConnection, path: str):
+    # Reuses the same keep-alive TCP connection for every probe
+    conn.request("GET", path)
+    r = conn.getresponse()
+    body = r.read()
+    if r.status >= 400:
+        raise RuntimeError(f"HTTP {r.status} {r.reason}")
+    return json.loads(body.decode("utf-8"))
 
 def main():
     print("==[verify_11_runtime_health]==")
@@ -21,21 +26,25 @@ def main():
     print("OPENAI_API_KEY set:", bool(os.getenv("OPENAI_API_KEY")))
     print("ELEVENLABS_API_KEY set:", bool(os.getenv("ELEVENLABS_API_KEY")))
 
-    # Backend HTTP
-    try:
-        root = http_json("http://127.0.0.1:8000/")
-        print("\nBackend /:", root)
-    except Exception as e:
-        print("\nBackend /: FAILED:", e)
-        print("Hint: is uvicorn running on 127.0.0.1:8000 ?")
-        return
-
-    # Tenant current
+    conn = http.client.HTTPConnection(BACKEND_HOST, BACKEND_PORT, timeout=3)
     try:
-        cur = http_json("http://127.0.0.1:8000/tenant/current")
-        print("Backend /tenant/current:", cur)
-    except Exception as e:
-        print("Backend /tenant/current: FAILED:", e)
+        # Backend HTTP
+        try:
+            root = http_json(conn, "/")
+            print("\nBackend /:", root)
+        except Exception as e:
+            print("\nBackend /: FAILED:", e)
+            print(f"Hint: is uvicorn running on {BACKEND_HOST}:{BACKEND_PORT} ?")
+            return
+
+        # Tenant current
+        try:
+            cur = http_json(conn, "/tenant/current")
+            print("Backend /tenant/current:", cur)
+        except Exception as e:
+            print("Backend /tenant/current: FAILED:", e)
+    finally:
+        conn.close()
 
     print("\nFrontend expected URL (when started): http://127.0.0.1:5173/voice_widget.html")
     print("WebSocket URL used by frontend: ws://127.0.0.1:8000/ws?session_id=...")
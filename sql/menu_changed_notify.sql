@@ -0,0 +1,24 @@
+-- Menu change notifications for MenuStore cache invalidation
+-- Publishes NOTIFY menu_changed, '<tenant_id>' on any write to menu_items / menu_item_aliases.
+-- Idempotent creation
+
+CREATE OR REPLACE FUNCTION notify_menu_changed() RETURNS trigger AS $$
+BEGIN
+    -- Postgres folds identical notifications within one transaction
+    PERFORM pg_notify(
+        'menu_changed',
+        CASE WHEN TG_OP = 'DELETE' THEN OLD.tenant_id ELSE NEW.tenant_id END::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_menu_items_changed ON menu_items;
+CREATE TRIGGER trg_menu_items_changed
+    AFTER INSERT OR UPDATE OR DELETE ON menu_items
+    FOR EACH ROW EXECUTE FUNCTION notify_menu_changed();
+
+DROP TRIGGER IF EXISTS trg_menu_item_aliases_changed ON menu_item_aliases;
+CREATE TRIGGER trg_menu_item_aliases_changed
+    AFTER INSERT OR UPDATE OR DELETE ON menu_item_aliases
+    FOR EACH ROW EXECUTE FUNCTION notify_menu_changed();
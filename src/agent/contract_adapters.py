@@ -1,13 +1,31 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+# One timestamp per logical response-building cycle (per asyncio task / thread).
+_batch_now: ContextVar[Optional[str]] = ContextVar("contract_adapters_batch_now", default=None)
 
 
 def _now_iso() -> str:
+    cached = _batch_now.get()
+    if cached is not None:
+        return cached
     return datetime.now(timezone.utc).isoformat()
 
 
+@contextmanager
+def batch() -> Iterator[str]:
+    """Stamp one ISO timestamp shared by every adapter call inside the block (nests safely)."""
+    token = _batch_now.set(datetime.now(timezone.utc).isoformat())
+    try:
+        yield _batch_now.get()
+    finally:
+        _batch_now.reset(token)
+
+
 def make_kitchen_status(
     tenant_id: str,
     wait_time_min: int,
@@ -28,6 +46,36 @@ def make_kitchen_status(
     }
 
 
+_MISSING = object()
+
+
+def _build_item(r: Dict[str, Any], cat_map: Dict[Any, str], currency: str) -> Dict[str, Any]:
+    get = r.get
+    item_id = str(get("item_id") or "")
+    name = (get("name_en") or get("name") or "").strip()
+    cat_id = get("category_id") or get("category") or None
+
+    # Availability heuristic:
+    # - If DB has explicit availability/available fields, use them
+    # - Otherwise default True (demo)
+    available = get("available", _MISSING)
+    if available is _MISSING:
+        available = get("availability", True)
+
+    return {
+        "item_id": item_id,
+        "name": name or item_id,
+        "description": get("description_en") or get("description") or None,
+        # Money object required by schema
+        "price": {"amount": float(get("price_delivery") or get("price") or 0.0), "currency": currency},
+        "available": bool(available),
+        # optional, but safe and schema-valid (lists: jsonschema "array" rejects tuples)
+        "tags": [],
+        "allergens": [],
+        "category": cat_map.get(str(cat_id)) if cat_id is not None else None,
+    }
+
+
 def make_menu(
     tenant_id: str,
     items: List[Dict[str, Any]],
@@ -53,39 +101,7 @@ def make_menu(
         if cid is not None and name:
             cat_map[str(cid)] = str(name)
 
-    menu_items: List[Dict[str, Any]] = []
-    for r in items:
-        item_id = str(r.get("item_id") or "")
-        name = (r.get("name_en") or r.get("name") or "").strip()
-        desc = (r.get("description_en") or r.get("description") or None)
-        cat_id = r.get("category_id") or r.get("category") or None
-        cat_name = cat_map.get(str(cat_id)) if cat_id is not None else None
-
-        # Availability heuristic:
-        # - If DB has explicit availability/available fields, use them
-        # - Otherwise default True (demo)
-        if "available" in r:
-            available = bool(r.get("available"))
-        elif "availability" in r:
-            available = bool(r.get("availability"))
-        else:
-            available = True
-
-        # Money object required by schema
-        price_amount = float(r.get("price_delivery") or r.get("price") or 0.0)
-
-        menu_items.append(
-            {
-                "item_id": item_id,
-                "name": name if name else item_id,
-                "description": desc,
-                "price": {"amount": price_amount, "currency": currency},
-                "available": available,
-                "tags": [],        # optional, but safe and schema-valid
-                "allergens": [],   # optional, but safe and schema-valid
-                "category": cat_name,
-            }
-        )
+    menu_items = [_build_item(r, cat_map, currency) for r in items]
 
     return {
         "tenant_id": tenant_id,
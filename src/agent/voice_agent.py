@@ -1,51 +1,117 @@
 import os
-import io
-import json
 import asyncio
+import hashlib
 import logging
-import wave
+import struct
+from itertools import islice
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, List
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, FrozenSet, Optional, List, Tuple
 
+import numpy as np
 import webrtcvad
 import httpx
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI
 
 logger = logging.getLogger("src.agent.voice_agent")
 
+# (voice_id, model_id, normalized text) -> mp3 bytes
+TTS_CACHE_MAX = 256
+# Streaming read size == binary WS frame size (same as src/api/server.py)
+TTS_CHUNK_BYTES = 12000
+
+# Fixed replies: synthesized once per voice, persisted under TTS_CACHE_DIR and
+# served from disk across restarts (LRU -> disk -> ElevenLabs).
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TTS_CACHE_DIR = Path(os.getenv("TTS_CACHE_DIR") or REPO_ROOT / ".cache" / "tts")
+
+GREETING = (
+    "Namaste! Welcome to Taj Mahal. "
+    "You can order in English, Nederlands, or हिंदी. "
+    "What would you like today?"
+)
+REPLY_NOT_CAUGHT = "Sorry, I didn't catch that. Could you repeat your order?"
+REPLY_ERROR = "Sorry, something went wrong. Could you repeat that?"
+TTS_PREWARM_PHRASES = (GREETING, REPLY_NOT_CAUGHT, REPLY_ERROR)
+
+# Free list of utterance buffers shared across sessions (event loop is single-threaded).
+# Buffers keep their capacity: SessionState writes at a cursor instead of clear()/extend(),
+# because bytearray.clear() releases the underlying allocation.
+PCM_PRESIZE = 96000  # 3s of 16kHz mono int16
+_PCM_POOL: "deque[bytearray]" = deque(maxlen=64)
+
+
+def _acquire_pcm() -> bytearray:
+    try:
+        return _PCM_POOL.pop()
+    except IndexError:
+        return bytearray(PCM_PRESIZE)
+
+
+def _release_pcm(buf: bytearray) -> None:
+    if len(_PCM_POOL) < (_PCM_POOL.maxlen or 0):
+        _PCM_POOL.append(buf)
+
+
+# Energy pre-gate (mean square of int16 samples): frames clearly below the floor are
+# silence, frames clearly above the ceiling during an utterance are speech; only the
+# ambiguous band goes to webrtcvad. Both bounds adapt to the room noise measured
+# over the first VAD_CALIBRATION_MS of each session (floor can only go down).
+VAD_SILENCE_FLOOR = 150.0 ** 2
+VAD_SPEECH_CEIL = 2000.0 ** 2
+VAD_CALIBRATION_MS = 500
+
+# anti-ghost: transcripts this similar to the last agent reply are treated as echo
+ECHO_SIMILARITY = 0.55
+
+# fixed control frames, serialized once
+_MSG_CLEAR_AUDIO = orjson.dumps({"type": "clear_audio_queue"}).decode()
+_MSG_AUDIO_START = orjson.dumps({"type": "agent_audio_start", "format": "mp3"}).decode()
+_MSG_AUDIO_END = orjson.dumps({"type": "agent_audio_end"}).decode()
+
+# language switch keywords (checked against the lowercased user turn)
+_DUTCH_TOKENS = ("nederlands", "dutch")
+_HINDI_TOKENS = ("hindi", "हिंदी")
+_ENGLISH_TOKENS = ("english",)
+
+
+# cheap normalize: drop punctuation in one C-level pass
+_PUNCT_TABLE = str.maketrans("", "", ".,!?:;\"'()[]")
+
 
 def _normalize_text(s: str) -> str:
-    s = (s or "").strip().lower()
-    # cheap normalize
-    for ch in [".", ",", "!", "?", ":", ";", "\"", "'", "(", ")", "[", "]"]:
-        s = s.replace(ch, "")
-    s = " ".join(s.split())
-    return s
-
-
-def _jaccard_similarity(a: str, b: str) -> float:
-    a = _normalize_text(a)
-    b = _normalize_text(b)
-    if not a or not b:
-        return 0.0
-    sa = set(a.split())
-    sb = set(b.split())
+    if not s:
+        return ""
+    return " ".join(s.lower().translate(_PUNCT_TABLE).split())
+
+
+def _tokens(s: str) -> FrozenSet[str]:
+    return frozenset(_normalize_text(s).split())
+
+
+def _jaccard_tokens(sa: FrozenSet[str], sb: FrozenSet[str], floor: float = 0.0) -> float:
     if not sa or not sb:
         return 0.0
+    small, large = sorted((len(sa), len(sb)))
+    # Jaccard <= |small| / |large|: skip the intersection when that bound can't reach floor
+    if small < floor * large:
+        return 0.0
     inter = len(sa & sb)
-    union = len(sa | sb)
-    return inter / union if union else 0.0
+    return inter / (len(sa) + len(sb) - inter)
 
 
 def pcm16_to_wav_bytes(pcm16: bytes, sample_rate: int = 16000) -> bytes:
-    """Wrap raw PCM16LE mono into a WAV container."""
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(sample_rate)
-        wf.writeframes(pcm16)
-    return buf.getvalue()
+    """Wrap raw PCM16LE mono into a WAV container (same bytes as the `wave` module)."""
+    n = len(pcm16)
+    return b"".join((
+        b"RIFF", struct.pack("<I", 36 + n), b"WAVE",
+        # fmt chunk: PCM, 1 channel, 16-bit
+        b"fmt ", struct.pack("<IHHIIHH", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16),
+        b"data", struct.pack("<I", n),
+        pcm16,
+    ))
 
 
 @dataclass
@@ -59,7 +125,9 @@ class SessionState:
     frame_ms: int = 20
     frame_bytes: int = 640  # 20ms @ 16k mono int16
     speeching: bool = False
-    speech_frames: List[bytes] = field(default_factory=list)
+    # current utterance PCM: pooled buffer, valid bytes are speech_pcm[:speech_len]
+    speech_pcm: bytearray = field(default_factory=_acquire_pcm)
+    speech_len: int = 0
 
     # VAD tuning
     min_speech_ms: int = 240         # need at least 240ms speech before STT
@@ -69,15 +137,42 @@ class SessionState:
     speech_ms: int = 0
     silence_ms: int = 0
 
+    # energy pre-gate (see VAD_SILENCE_FLOOR); calibrated from the first frames
+    energy_floor: float = VAD_SILENCE_FLOOR
+    energy_ceil: float = VAD_SPEECH_CEIL
+    calib_ms: int = 0
+    calib_energy: float = 0.0
+
     # Agent playback hints (client reports start/end)
     agent_playing: bool = False
     last_agent_text: str = ""
+    last_agent_tokens: FrozenSet[str] = frozenset()  # _tokens(last_agent_text)
     last_agent_play_ts: float = 0.0
 
-    # Conversation memory
-    history: List[Dict[str, str]] = field(default_factory=list)
+    # Conversation memory (last 12 turns; maxlen drops the oldest)
+    history: "deque[Dict[str, str]]" = field(default_factory=lambda: deque(maxlen=24))
     language: str = "english"
 
+    # set on disconnect; in-flight audio tasks for this session stop touching it
+    closed: bool = False
+
+    def close(self) -> None:
+        """Detach the pooled utterance buffer before handing it back, so late frames can't reach it."""
+        if self.closed:
+            return
+        self.closed = True
+        buf, self.speech_pcm = self.speech_pcm, bytearray()
+        self.speech_len = 0
+        _release_pcm(buf)
+
+    def append_speech(self, frame: bytes) -> None:
+        if self.closed:
+            return
+        # Overwrite in place; only grows past capacity (long utterances), never shrinks
+        end = self.speech_len + len(frame)
+        self.speech_pcm[self.speech_len:end] = frame
+        self.speech_len = end
+
 
 class VoiceAgent:
     """
@@ -89,8 +184,14 @@ class VoiceAgent:
     """
 
     def __init__(self):
-        self.openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.http = httpx.AsyncClient(timeout=30.0)
+        self.openai = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        # One pooled client for all sessions; HTTP/2 multiplexes concurrent TTS streams
+        # over a single TLS connection to ElevenLabs.
+        self.http = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0),
+        )
 
         self.stt_model = os.getenv("OPENAI_STT_MODEL", "gpt-4o-mini-transcribe")
         self.chat_model = os.getenv("OPENAI_CHAT_MODEL", "gpt-4o-mini")
@@ -101,6 +202,18 @@ class VoiceAgent:
         self.voice_english = os.getenv("ELEVENLABS_VOICE_ENGLISH") or os.getenv("ELEVENLABS_VOICE_ID")
         self.voice_dutch = os.getenv("ELEVENLABS_VOICE_DUTCH")
         self.voice_hindi = os.getenv("ELEVENLABS_VOICE_HINDI")
+        # st.language values set by _chat -> voice (English as fallback)
+        self._voice_by_lang: Dict[str, Optional[str]] = {
+            "english": self.voice_english,
+            "dutch": self.voice_dutch or self.voice_english,
+            "hindi": self.voice_hindi or self.voice_english,
+        }
+
+        # LRU of synthesized replies (greeting, stock confirmations, ...)
+        self._tts_cache: "OrderedDict[Tuple[str, str, str], bytes]" = OrderedDict()
+        # normalized fixed replies that also go to the disk tier
+        self._tts_disk_texts = frozenset(_normalize_text(t) for t in TTS_PREWARM_PHRASES)
+        self._tts_warm_task: Optional[asyncio.Task] = None
 
         # session_id -> state
         self.sessions: Dict[str, SessionState] = {}
@@ -114,6 +227,9 @@ class VoiceAgent:
     # ---------------------------
     async def on_connect(self, session_id: str, ws: Any, sample_rate: int = 16000):
         self.ws[session_id] = ws
+        old = self.sessions.get(session_id)
+        if old is not None:
+            old.close()
         st = SessionState(sample_rate=sample_rate)
 
         # Compute frame_bytes based on sample_rate (must stay 20ms)
@@ -126,16 +242,17 @@ class VoiceAgent:
         self.sessions[session_id] = st
 
         # Greeting (text + audio)
-        greeting = (
-            "Namaste! Welcome to Taj Mahal. "
-            "You can order in English, Nederlands, or हिंदी. "
-            "What would you like today?"
-        )
-        await self._send_agent(session_id, greeting)
+        await self._send_agent(session_id, GREETING)
+
+        # First session: fill the disk tier for the remaining fixed replies in the background
+        if self._tts_warm_task is None and self.eleven_api_key:
+            self._tts_warm_task = asyncio.create_task(self.warm_tts_cache())
 
     async def on_disconnect(self, session_id: str):
         self.ws.pop(session_id, None)
-        self.sessions.pop(session_id, None)
+        st = self.sessions.pop(session_id, None)
+        if st:
+            st.close()
 
     async def on_client_event(self, session_id: str, data: Dict[str, Any]):
         st = self.sessions.get(session_id)
@@ -154,7 +271,7 @@ class VoiceAgent:
 
         if t == "barge_in":
             # client already stopped playback; we can optionally clear pending TTS queue
-            await self._send_json(session_id, {"type": "clear_audio_queue"})
+            await self._send_raw(session_id, _MSG_CLEAR_AUDIO)
             return
 
         if t == "client_mode":
@@ -171,23 +288,57 @@ class VoiceAgent:
         if not chunk:
             return
 
-        # Append to raw PCM buffer (client sends int16le)
-        st.pcm_buffer.extend(chunk)
-
-        # Process frames
-        while len(st.pcm_buffer) >= st.frame_bytes:
-            frame = bytes(st.pcm_buffer[:st.frame_bytes])
-            del st.pcm_buffer[:st.frame_bytes]
-            await self._process_vad_frame(session_id, st, frame)
-
-    async def _process_vad_frame(self, session_id: str, st: SessionState, frame: bytes):
-        # VAD expects 16-bit PCM mono at supported rates, frame must be 10/20/30ms.
-        is_speech = False
-        try:
-            is_speech = st.vad.is_speech(frame, st.sample_rate)
-        except Exception:
-            # if something is off, ignore this frame
+        n = st.frame_bytes
+        buf = st.pcm_buffer
+        if not buf and len(chunk) % n == 0:
+            # Fast path: packet is whole frames, no residual -> no buffering at all
+            data = chunk
+        else:
+            # Append to raw PCM buffer (client sends int16le)
+            buf.extend(chunk)
+            usable = len(buf) - (len(buf) % n)
+            if not usable:
+                return
+            # One copy + one trim per packet (not per frame); the buffer is consistent
+            # before any await, so a concurrent packet can extend it safely.
+            with memoryview(buf) as mv:
+                data = bytes(mv[:usable])
+            del buf[:usable]
+
+        # Process frames as zero-copy windows (webrtcvad accepts the buffer protocol)
+        frames = memoryview(data)
+        for i in range(0, len(data), n):
+            if st.closed:
+                return
+            await self._process_vad_frame(session_id, st, frames[i:i + n])
+
+    async def _process_vad_frame(self, session_id: str, st: SessionState, frame: bytes | memoryview):
+        if st.closed:
             return
+        # Cheap energy pre-gate; webrtcvad only for the ambiguous band (and while calibrating)
+        samples = np.frombuffer(frame, dtype=np.int16).astype(np.float64)
+        energy = float(np.dot(samples, samples)) / max(1, samples.size)
+
+        is_speech: Optional[bool] = None
+        if st.calib_ms < VAD_CALIBRATION_MS:
+            st.calib_ms += st.frame_ms
+            st.calib_energy += energy
+            if st.calib_ms >= VAD_CALIBRATION_MS:
+                noise = st.calib_energy * st.frame_ms / st.calib_ms
+                st.energy_floor = min(VAD_SILENCE_FLOOR, 2.0 * noise)
+                st.energy_ceil = max(VAD_SPEECH_CEIL, 16.0 * noise)
+        elif energy < st.energy_floor:
+            is_speech = False
+        elif st.speeching and energy > st.energy_ceil:
+            is_speech = True
+
+        if is_speech is None:
+            # VAD expects 16-bit PCM mono at supported rates, frame must be 10/20/30ms.
+            try:
+                is_speech = st.vad.is_speech(frame, st.sample_rate)
+            except Exception:
+                # if something is off, ignore this frame
+                return
 
         if is_speech:
             st.silence_ms = 0
@@ -195,15 +346,15 @@ class VoiceAgent:
 
             if not st.speeching:
                 st.speeching = True
-                st.speech_frames = []
+                st.speech_len = 0
                 st.speech_ms = st.frame_ms
                 st.silence_ms = 0
 
                 # HARD-MODE barge-in:
                 # As soon as we detect user speech, kill agent playback on client
-                await self._send_json(session_id, {"type": "clear_audio_queue"})
+                await self._send_raw(session_id, _MSG_CLEAR_AUDIO)
 
-            st.speech_frames.append(frame)
+            st.append_speech(frame)
 
             # safety cap
             if st.speech_ms >= st.max_utterance_ms:
@@ -216,7 +367,7 @@ class VoiceAgent:
                 # still keep a tiny tail (optional) -> helps last phonemes
                 # but don't add too much silence
                 if st.silence_ms <= 120:
-                    st.speech_frames.append(frame)
+                    st.append_speech(frame)
 
                 if st.silence_ms >= st.end_silence_ms:
                     await self._finalize_utterance(session_id, st)
@@ -229,11 +380,12 @@ class VoiceAgent:
         st.silence_ms = 0
 
         if total_ms < st.min_speech_ms:
-            st.speech_frames = []
+            st.speech_len = 0
             return
 
-        pcm16 = b"".join(st.speech_frames)
-        st.speech_frames = []
+        with memoryview(st.speech_pcm) as mv:
+            pcm16 = bytes(mv[:st.speech_len])
+        st.speech_len = 0
 
         # Convert to WAV and transcribe
         wav_bytes = pcm16_to_wav_bytes(pcm16, sample_rate=st.sample_rate)
@@ -253,15 +405,12 @@ class VoiceAgent:
     # ---------------------------
     async def _transcribe_wav(self, session_id: str, st: SessionState, wav_bytes: bytes) -> Optional[str]:
         try:
-            audio_file = io.BytesIO(wav_bytes)
-            audio_file.name = "audio.wav"  # critical: correct extension
-
-            kwargs = {
-                "model": self.stt_model,
-                "file": audio_file,
-                "temperature": 0.0,
-            }
-            resp = await asyncio.to_thread(lambda: self.openai.audio.transcriptions.create(**kwargs))
+            resp = await self.openai.audio.transcriptions.create(
+                model=self.stt_model,
+                # (filename, content, content_type): no BytesIO copy; critical: correct extension
+                file=("audio.wav", wav_bytes, "audio/wav"),
+                temperature=0.0,
+            )
             text = getattr(resp, "text", "") or ""
             text = text.strip()
             if not text:
@@ -272,9 +421,9 @@ class VoiceAgent:
             now = asyncio.get_event_loop().time()
             recently_playing = st.agent_playing or ((now - st.last_agent_play_ts) < 1.2)
 
-            if recently_playing and st.last_agent_text:
-                sim = _jaccard_similarity(text, st.last_agent_text)
-                if sim >= 0.55:
+            if recently_playing and st.last_agent_tokens:
+                sim = _jaccard_tokens(_tokens(text), st.last_agent_tokens, ECHO_SIMILARITY)
+                if sim >= ECHO_SIMILARITY:
                     logger.info("[%s] dropping likely-echo transcript (sim=%.2f): %r", session_id, sim, text)
                     return None
 
@@ -292,6 +441,9 @@ class VoiceAgent:
     # CHAT + TTS
     # ---------------------------
     def _voice_for_language(self, lang: str) -> Optional[str]:
+        voice = self._voice_by_lang.get(lang)
+        if voice is not None:
+            return voice
         lang = (lang or "").lower().strip()
         if lang.startswith("dut") or "neder" in lang:
             return self.voice_dutch or self.voice_english
@@ -302,11 +454,11 @@ class VoiceAgent:
     async def _chat(self, session_id: str, st: SessionState, user_text: str) -> str:
         # lightweight language switching
         ut = (user_text or "").lower()
-        if "nederlands" in ut or "dutch" in ut:
+        if any(t in ut for t in _DUTCH_TOKENS):
             st.language = "dutch"
-        elif "hindi" in ut or "हिंदी" in user_text:
+        elif any(t in ut for t in _HINDI_TOKENS):
             st.language = "hindi"
-        elif "english" in ut:
+        elif any(t in ut for t in _ENGLISH_TOKENS):
             st.language = "english"
 
         system = (
@@ -319,34 +471,63 @@ class VoiceAgent:
 
         messages = [{"role": "system", "content": system}]
         if st.history:
-            messages.extend(st.history[-10:])
+            messages.extend(islice(st.history, max(0, len(st.history) - 10), None))
         messages.append({"role": "user", "content": user_text})
 
         try:
-            resp = await asyncio.to_thread(
-                lambda: self.openai.chat.completions.create(
-                    model=self.chat_model,
-                    messages=messages,
-                    temperature=0.4,
-                )
+            resp = await self.openai.chat.completions.create(
+                model=self.chat_model,
+                messages=messages,
+                temperature=0.4,
             )
             content = resp.choices[0].message.content if resp and resp.choices else ""
             content = (content or "").strip()
             if not content:
-                content = "Sorry, I didn't catch that. Could you repeat your order?"
+                content = REPLY_NOT_CAUGHT
 
-            st.history = (st.history + [{"role": "user", "content": user_text}, {"role": "assistant", "content": content}])[-24:]
+            st.history.append({"role": "user", "content": user_text})
+            st.history.append({"role": "assistant", "content": content})
             return content
         except Exception as e:
             logger.exception("[%s] LLM error: %s", session_id, e)
-            return "Sorry, something went wrong. Could you repeat that?"
+            return REPLY_ERROR
 
-    async def _tts_elevenlabs(self, st: SessionState, text: str) -> bytes:
+    async def _tts_elevenlabs(self, st: SessionState, text: str) -> AsyncIterator[bytes]:
+        """
+        Yields MP3 chunks for the session's voice (nothing when TTS is unavailable).
+        """
         if not self.eleven_api_key:
-            return b""
+            return
         voice_id = self._voice_for_language(st.language)
         if not voice_id:
-            return b""
+            return
+        async for chunk in self._tts_stream(voice_id, text):
+            yield chunk
+
+    async def _tts_stream(self, voice_id: str, text: str) -> AsyncIterator[bytes]:
+        """
+        Yields MP3 chunks as ElevenLabs streams them.
+        Lookup order: in-memory LRU -> disk (fixed replies only) -> ElevenLabs;
+        cache hits are replayed in TTS_CHUNK_BYTES slices.
+        """
+        key = (voice_id, self.eleven_model_id, _normalize_text(text))
+        on_disk = key[2] in self._tts_disk_texts
+
+        hit = self._tts_cache.get(key)
+        if hit is not None:
+            self._tts_cache.move_to_end(key)
+        elif on_disk:
+            try:
+                # file I/O off the event loop (other sessions keep streaming)
+                hit = await asyncio.to_thread(self._tts_disk_path(key).read_bytes)
+            except OSError:
+                hit = None
+            else:
+                self._tts_remember(key, hit)
+        if hit is not None:
+            for i in range(0, len(hit), TTS_CHUNK_BYTES):
+                yield hit[i:i + TTS_CHUNK_BYTES]
+            return
 
         url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
         headers = {
@@ -356,12 +537,54 @@ class VoiceAgent:
         }
         payload = {"text": text, "model_id": self.eleven_model_id}
 
+        parts: List[bytes] = []
         try:
-            r = await self.http.post(url, headers=headers, json=payload)
-            r.raise_for_status()
-            return r.content
+            async with self.http.stream("POST", url, headers=headers, json=payload) as r:
+                r.raise_for_status()
+                async for chunk in r.aiter_bytes(TTS_CHUNK_BYTES):
+                    parts.append(chunk)
+                    yield chunk
         except Exception:
-            return b""
+            return
+        if not parts:
+            return
+
+        audio = b"".join(parts)
+        self._tts_remember(key, audio)
+        if on_disk:
+            await asyncio.to_thread(self._tts_disk_write, key, audio)
+
+    def _tts_remember(self, key: Tuple[str, str, str], audio: bytes) -> None:
+        self._tts_cache[key] = audio
+        if len(self._tts_cache) > TTS_CACHE_MAX:
+            self._tts_cache.popitem(last=False)
+
+    def _tts_disk_path(self, key: Tuple[str, str, str]) -> Path:
+        digest = hashlib.sha1("|".join(key).encode("utf-8")).hexdigest()
+        return TTS_CACHE_DIR / f"{digest}.mp3"
+
+    def _tts_disk_write(self, key: Tuple[str, str, str], audio: bytes) -> None:
+        # blocking; called via asyncio.to_thread
+        path = self._tts_disk_path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(audio)
+            os.replace(tmp, path)  # atomic: readers never see a partial file
+        except OSError as e:
+            logger.warning("TTS disk cache write failed (%s): %s", path, e)
+
+    async def warm_tts_cache(self) -> None:
+        """Synthesize TTS_PREWARM_PHRASES for every configured voice that isn't cached yet."""
+        voices = {v for v in self._voice_by_lang.values() if v}
+        for voice_id in voices:
+            for phrase in TTS_PREWARM_PHRASES:
+                key = (voice_id, self.eleven_model_id, _normalize_text(phrase))
+                if key in self._tts_cache or await asyncio.to_thread(self._tts_disk_path(key).exists):
+                    continue
+                async for _ in self._tts_stream(voice_id, phrase):
+                    pass
+        logger.info("TTS cache warm (%d voices, %d phrases)", len(voices), len(TTS_PREWARM_PHRASES))
 
     async def _send_agent(self, session_id: str, text: str):
         st = self.sessions.get(session_id)
@@ -369,22 +592,40 @@ class VoiceAgent:
             return
 
         st.last_agent_text = text or ""
+        st.last_agent_tokens = _tokens(st.last_agent_text)
 
         # send text
         await self._send_json(session_id, {"type": "agent_text", "text": text})
 
-        # send audio (if configured)
-        audio = await self._tts_elevenlabs(st, text)
-        if audio:
-            b64 = __import__("base64").b64encode(audio).decode("ascii")
-            await self._send_json(session_id, {"type": "agent_audio", "audio_base64": b64})
+        # stream audio (if configured): agent_audio_start -> binary MP3 frames -> agent_audio_end
+        started = False
+        async for chunk in self._tts_elevenlabs(st, text):
+            if not started:
+                started = True
+                await self._send_raw(session_id, _MSG_AUDIO_START)
+            await self._send_bytes(session_id, chunk)
+        if started:
+            await self._send_raw(session_id, _MSG_AUDIO_END)
 
     async def _send_json(self, session_id: str, payload: Dict[str, Any]):
+        # JSON stays on text frames; binary frames are reserved for audio (as in src/api/server.py)
+        await self._send_raw(session_id, orjson.dumps(payload).decode())
+
+    async def _send_bytes(self, session_id: str, data: bytes):
+        ws = self.ws.get(session_id)
+        if not ws:
+            return
+        try:
+            await ws.send_bytes(data)
+        except Exception:
+            pass
+
+    async def _send_raw(self, session_id: str, raw: str):
         ws = self.ws.get(session_id)
         if not ws:
             return
         try:
-            await ws.send_text(json.dumps(payload))
+            await ws.send_text(raw)
         except Exception:
             pass
 
@@ -2,7 +2,10 @@ import os
 import json
 import logging
 import asyncio
+import re
+import time
 from datetime import datetime, timezone
+from typing import Awaitable, Callable, List, Optional, Tuple
 
 from dotenv import load_dotenv
 import openai
@@ -10,6 +13,7 @@ from elevenlabs import ElevenLabs
 
 from src.db.database import db
 from src.api.contract_validate import validate_payload
+from src.agent import contract_adapters
 from src.agent.contract_adapters import make_kitchen_status, make_menu
 
 load_dotenv()
@@ -20,14 +24,91 @@ logger = logging.getLogger(__name__)
 DEMO_TENANT_ID = os.getenv("DEMO_TENANT_ID") or "ca25e23c-c1a2-41e7-82be-ad8187c4c459"
 DEMO_LOCATION_ID = os.getenv("DEMO_LOCATION_ID") or None
 
+# get_menu() is called repeatedly within one order conversation; menus change on the order of hours
+MENU_CACHE_TTL_S = float(os.getenv("MENU_CACHE_TTL_S", "60"))
+
+# create_pos_order: customer + order + items in one round trip.
+# Items arrive as parallel arrays ($6..$9); a missing/zero unit price falls back to the
+# tenant's delivery price, and the order total is summed from the priced lines.
+CREATE_ORDER_SQL = """
+WITH ins_cust AS (
+    INSERT INTO customers (tenant_id, name, phone)
+    VALUES ($1, $2, $3)
+    RETURNING customer_id
+),
+priced AS (
+    SELECT i.ord, i.item_id, i.qty, i.cust,
+           COALESCE(NULLIF(i.price, 0), m.price_delivery::float8, 0) AS unit
+    FROM unnest($6::text[], $7::int[], $8::float8[], $9::jsonb[])
+         WITH ORDINALITY AS i(item_id, qty, price, cust, ord)
+    LEFT JOIN LATERAL (
+        SELECT price_delivery FROM menu_items
+        WHERE item_id = i.item_id AND tenant_id = $1
+        LIMIT 1
+    ) m ON true
+),
+ins_order AS (
+    INSERT INTO orders (tenant_id, customer_id, order_type, total_amount, session_id, order_status, created_at, language, notes)
+    SELECT $1, c.customer_id, $4, (SELECT COALESCE(SUM(unit * qty), 0) FROM priced), $5, 'NEW', $10, NULL, NULL
+    FROM ins_cust c
+    RETURNING order_id
+),
+ins_items AS (
+    INSERT INTO order_items (tenant_id, order_id, item_id, quantity, price_at_order, customizations)
+    SELECT $1, o.order_id, p.item_id, p.qty, p.unit * p.qty, p.cust
+    FROM ins_order o CROSS JOIN priced p
+    ORDER BY p.ord
+)
+SELECT order_id FROM ins_order
+"""
+
+IDEMPOTENT_ORDER_SQL = """
+SELECT order_id, created_at
+FROM orders
+WHERE tenant_id = $1 AND session_id = $2
+ORDER BY created_at DESC
+LIMIT 1
+"""
+
+# Prepared once per pooled connection (see Database.register_statement)
+db.register_statement("create_pos_order", CREATE_ORDER_SQL)
+db.register_statement("idempotent_order", IDEMPOTENT_ORDER_SQL)
+
+# Sentence boundary inside a streamed reply: terminal punctuation followed by whitespace
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s)")
+
+
+def _split_sentences(buf: str) -> Tuple[List[str], str]:
+    """Split off complete sentences; returns (sentences, unfinished tail)."""
+    sentences = []
+    start = 0
+    for m in _SENTENCE_END_RE.finditer(buf):
+        sentence = buf[start:m.end()].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = m.end()
+    return sentences, buf[start:]
+
+
+async def _drain_sentences(queue: "asyncio.Queue[Optional[str]]", on_sentence: Callable[[str], Awaitable[None]]):
+    # One consumer keeps sentence audio in order while the LLM keeps generating
+    while (sentence := await queue.get()) is not None:
+        try:
+            await on_sentence(sentence)
+        except Exception as e:
+            logger.error(f"on_sentence failed: {e}")
+
+
 class VoiceAgent:
     def __init__(self):
-        self.openai_client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.openai_client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.elevenlabs = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
         self.voice_id = os.getenv("ELEVENLABS_VOICE_ID", "wlmwDR77ptH6bKHZui0l")
 
         self.conversations = {}
         self.session_orders = {}
+        # (tenant_id, location_id) -> (fetched_at monotonic, validated menu payload, payload JSON)
+        self._menu_cache = {}
         logger.info(f"✅ VoiceAgent initialized with voice: {self.voice_id}")
 
     async def _ensure_db(self):
@@ -84,8 +165,7 @@ TOOLS YOU CAN USE:
         import io
         audio_file = io.BytesIO(audio_bytes)
         audio_file.name = "audio.webm"
-        transcript = await asyncio.to_thread(
-            self.openai_client.audio.transcriptions.create,
+        transcript = await self.openai_client.audio.transcriptions.create(
             model=os.getenv("OPENAI_STT_MODEL", "whisper-1"),
             file=audio_file
         )
@@ -109,6 +189,19 @@ TOOLS YOU CAN USE:
         return payload
 
     async def get_menu(self) -> dict:
+        return (await self._cached_menu())[1]
+
+    async def get_menu_json(self) -> str:
+        """get_menu() serialized for the function-result message (serialized once per fetch)."""
+        return (await self._cached_menu())[2]
+
+    async def _cached_menu(self) -> tuple:
+        key = (DEMO_TENANT_ID, DEMO_LOCATION_ID)
+        now = time.monotonic()
+        cached = self._menu_cache.get(key)
+        if cached and now - cached[0] < MENU_CACHE_TTL_S:
+            return cached
+
         await self._ensure_db()
         items = await db.get_menu_items()
         categories = await db.get_categories()
@@ -121,7 +214,8 @@ TOOLS YOU CAN USE:
             currency="EUR",
         )
         validate_payload("domain/menu.v0.6.json", payload)
-        return payload
+        cached = self._menu_cache[key] = (now, payload, json.dumps(payload, ensure_ascii=False))
+        return cached
 
     async def create_pos_order(self, order_draft: dict) -> dict:
         """
@@ -152,16 +246,8 @@ TOOLS YOU CAN USE:
         async with db.pool.acquire() as con:
             # 1) idempotency check (demo approach)
             if idempotency_key:
-                existing = await con.fetchrow(
-                    """
-                    SELECT order_id, created_at
-                    FROM orders
-                    WHERE tenant_id = $1 AND session_id = $2
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                    """,
-                    tenant_id, db_session_id
-                )
+                stmt = await db.prepared(con, "idempotent_order")
+                existing = await stmt.fetchrow(tenant_id, db_session_id)
                 if existing:
                     result = {
                         "tenant_id": tenant_id,
@@ -176,71 +262,36 @@ TOOLS YOU CAN USE:
                     validate_payload("domain/order_result.v0.6.json", result)
                     return result
 
-            # 2) create customer
-            customer_id = await con.fetchval(
-                """
-                INSERT INTO customers (tenant_id, name, phone)
-                VALUES ($1, $2, $3)
-                RETURNING customer_id
-                """,
-                tenant_id,
-                customer_name or f"Voice Customer ({session_id[:8]})",
-                customer_phone or db_session_id
-            )
-
-            # 3) create order (total computed from items)
-            created_at = datetime.now(timezone.utc)
-            order_id = await con.fetchval(
-                """
-                INSERT INTO orders (tenant_id, customer_id, order_type, total_amount, session_id, order_status, created_at, language, notes)
-                VALUES ($1, $2, $3, 0, $4, 'NEW', $5, NULL, NULL)
-                RETURNING order_id
-                """,
-                tenant_id, customer_id, order_type, db_session_id, created_at
-            )
-
-            total_amount = 0.0
+            # 2) customer + order + items (+ price fallback, total) in one statement
+            item_ids, qtys, prices, customs = [], [], [], []
             for it in order_draft["items"]:
-                item_id = it["item_id"]
-                qty = int(it["quantity"])
+                item_ids.append(it["item_id"])
+                qtys.append(int(it["quantity"]))
 
-                # Unit price: use contract if present, else lookup delivery price
-                unit_price = None
-                if it.get("unit_price") and isinstance(it["unit_price"], dict):
-                    unit_price = float(it["unit_price"].get("amount", 0.0))
-
-                if unit_price is None or unit_price == 0.0:
-                    row = await con.fetchrow(
-                        "SELECT price_delivery FROM menu_items WHERE item_id = $1 AND tenant_id = $2",
-                        item_id, tenant_id
-                    )
-                    unit_price = float(row["price_delivery"]) if row else 0.0
-
-                line_total = unit_price * qty
-                total_amount += line_total
+                # Unit price: use contract if present (0 -> lookup delivery price in SQL)
+                unit_price = it.get("unit_price")
+                prices.append(float(unit_price.get("amount", 0.0)) if isinstance(unit_price, dict) else 0.0)
 
                 customizations = {}
                 if it.get("modifiers") is not None:
                     customizations["modifiers"] = it.get("modifiers") or []
                 if it.get("notes"):
                     customizations["notes"] = it.get("notes")
+                customs.append(json.dumps(customizations) if customizations else None)
 
-                await con.execute(
-                    """
-                    INSERT INTO order_items (tenant_id, order_id, item_id, quantity, price_at_order, customizations)
-                    VALUES ($1, $2, $3, $4, $5, $6::jsonb)
-                    """,
-                    tenant_id,
-                    order_id,
-                    item_id,
-                    qty,
-                    line_total,
-                    json.dumps(customizations) if customizations else None
-                )
-
-            await con.execute(
-                "UPDATE orders SET total_amount = $1 WHERE order_id = $2",
-                total_amount, order_id
+            created_at = datetime.now(timezone.utc)
+            stmt = await db.prepared(con, "create_pos_order")
+            order_id = await stmt.fetchval(
+                tenant_id,
+                customer_name or f"Voice Customer ({session_id[:8]})",
+                customer_phone or db_session_id,
+                order_type,
+                db_session_id,
+                item_ids,
+                qtys,
+                prices,
+                customs,
+                created_at,
             )
 
         result = {
@@ -261,7 +312,18 @@ TOOLS YOU CAN USE:
     # LLM interaction
     # ----------------------------
 
-    async def generate_response(self, session_id: str, user_text: str, is_greeting=False):
+    async def generate_response(
+        self,
+        session_id: str,
+        user_text: str,
+        is_greeting=False,
+        on_sentence: Optional[Callable[[str], Awaitable[None]]] = None,
+    ):
+        """
+        Returns the full reply text. After a tool call the follow-up completion is streamed;
+        if on_sentence is given it is awaited (in order) with each complete sentence as soon
+        as it is generated, so TTS of sentence 1 overlaps decoding of sentence 2.
+        """
         if is_greeting:
             return "Namaste! Welcome to Taj Mahal restaurant. What would you like to order today?"
 
@@ -294,8 +356,7 @@ TOOLS YOU CAN USE:
             },
         ]
 
-        response = await asyncio.to_thread(
-            self.openai_client.chat.completions.create,
+        response = await self.openai_client.chat.completions.create(
             model=os.getenv("OPENAI_CHAT_MODEL", "gpt-4o-mini"),
             messages=conversation,
             functions=functions,
@@ -318,30 +379,55 @@ TOOLS YOU CAN USE:
 
             logger.info(f"🔍 Calling function: {function_name} args keys: {list(function_args.keys())}")
 
-            if function_name == "get_menu":
-                function_result = await self.get_menu()
-            elif function_name == "get_kitchen_status":
-                function_result = await self.get_kitchen_status()
-            elif function_name == "create_pos_order":
-                function_result = await self.create_pos_order(function_args["order_draft"])
-            else:
-                function_result = {"error": "Unknown function"}
+            # one contract timestamp for every payload built while answering this call
+            with contract_adapters.batch():
+                if function_name == "get_menu":
+                    function_content = await self.get_menu_json()
+                else:
+                    if function_name == "get_kitchen_status":
+                        function_result = await self.get_kitchen_status()
+                    elif function_name == "create_pos_order":
+                        function_result = await self.create_pos_order(function_args["order_draft"])
+                    else:
+                        function_result = {"error": "Unknown function"}
+                    function_content = json.dumps(function_result, ensure_ascii=False)
 
             conversation.append({
                 "role": "function",
                 "name": function_name,
-                "content": json.dumps(function_result, ensure_ascii=False)
+                "content": function_content
             })
 
-            second_response = await asyncio.to_thread(
-                self.openai_client.chat.completions.create,
+            stream = await self.openai_client.chat.completions.create(
                 model=os.getenv("OPENAI_CHAT_MODEL", "gpt-4o-mini"),
                 messages=conversation,
                 temperature=0.7,
-                max_tokens=180
+                max_tokens=180,
+                stream=True
             )
 
-            final_message = second_response.choices[0].message.content
+            queue = asyncio.Queue()
+            worker = asyncio.create_task(_drain_sentences(queue, on_sentence)) if on_sentence else None
+            parts = []
+            pending = ""
+            try:
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    parts.append(delta)
+                    if worker:
+                        sentences, pending = _split_sentences(pending + delta)
+                        for sentence in sentences:
+                            queue.put_nowait(sentence)
+            finally:
+                if worker:
+                    if pending.strip():
+                        queue.put_nowait(pending.strip())
+                    queue.put_nowait(None)
+                    await worker
+
+            final_message = "".join(parts)
             conversation.append({"role": "assistant", "content": final_message})
             return final_message
 
@@ -364,8 +450,7 @@ TOOLS YOU CAN USE:
 
         except Exception as e:
             logger.error(f"ElevenLabs TTS error: {e}, falling back to OpenAI")
-            response = await asyncio.to_thread(
-                self.openai_client.audio.speech.create,
+            response = await self.openai_client.audio.speech.create(
                 model="tts-1",
                 voice="nova",
                 input=text
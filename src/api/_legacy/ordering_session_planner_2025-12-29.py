@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from ..intent import MarkerScanner
 from ..policy import SessionPolicyState, restricted_recommendation_pool, is_followup_recommendation
 
 
@@ -14,15 +17,21 @@ class SessionPhase(str, Enum):
     UPSELL_OFFERED = "upsell_offered"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponsePlan:
     reply: str
     phase: SessionPhase
-    debug: Dict[str, Any] = None
+    debug: Dict[str, Any] = field(default_factory=dict)
 
 
-_ACK_NL = {"ok", "oke", "oké", "prima", "goed", "top", "ja", "hallo"}
-_ACK_EN = {"ok", "okay", "sure", "yes", "hi"}
+_ACK_NL = frozenset({"ok", "oke", "oké", "prima", "goed", "top", "ja", "hallo"})
+_ACK_EN = frozenset({"ok", "okay", "sure", "yes", "hi"})
+_ACK: Dict[str, frozenset] = {"nl": _ACK_NL, "en": _ACK_EN}
+
+
+def _is_ack(lang: str, t: str) -> bool:
+    """Weak acknowledgement ("ok", "ja", ...); every non-Dutch language uses the English set."""
+    return t in _ACK["nl" if lang == "nl" else "en"]
 
 
 def _contains_question(text: str) -> bool:
@@ -40,13 +49,17 @@ def _cart_item_names_lower(state: Any) -> List[str]:
     items = getattr(order, "items", None)
     if not menu or not isinstance(items, dict):
         return out
+    name_safe = getattr(menu, "display_name_safe", None)
     for item_id, qty in items.items():
         if int(qty or 0) <= 0:
             continue
-        try:
-            nm = menu.display_name(item_id)
-        except Exception:
-            nm = str(item_id)
+        if name_safe is not None:
+            nm = name_safe(item_id) or str(item_id)
+        else:
+            try:
+                nm = menu.display_name(item_id)
+            except Exception:
+                nm = str(item_id)
         if nm:
             out.append(nm.lower())
     return out
@@ -58,43 +71,62 @@ def _menu_items_from_context(menu_context: str) -> List[str]:
       - Item A
       - Item B
     """
-    items: List[str] = []
-    for line in (menu_context or "").splitlines():
-        line = line.strip()
-        if line.startswith("- "):
-            items.append(line[2:].strip())
-    return [x for x in items if x]
+    return list(_parse_menu_lines(menu_context or ""))
+
+
+# "- Item" lines; whitespace around the bullet and the name is ignored, empty names are skipped
+_MENU_LINE_RE = re.compile(r"^[^\S\n]*- [^\S\n]*(\S.*?)[^\S\n]*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=8)
+def _parse_menu_lines(menu_context: str) -> Tuple[str, ...]:
+    # the sticky-pool and upsell branches parse the same context within one turn
+    return tuple(_MENU_LINE_RE.findall(menu_context))
+
+
+# Upsell preference order; bit i of a scan <=> _UPSELL_PREFER[i] occurs in the item name
+_UPSELL_PREFER = ("rice", "rijst", "naan", "garlic", "knoflook", "lassi", "mango", "kulfi", "dessert", "bier", "beer")
+_UPSELL_SCANNER = MarkerScanner({p: (p,) for p in _UPSELL_PREFER})
 
 
 def _pick_simple_upsell(menu_items: Sequence[str], cart_lower: Sequence[str], lang: str) -> List[str]:
     """
     Very simple upsell: prefer rice/naan/drinks/dessert not already in cart.
     """
-    prefer = ["rice", "rijst", "naan", "garlic", "knoflook", "lassi", "mango", "kulfi", "dessert", "bier", "beer"]
     picked: List[str] = []
+    picked_set: set[str] = set()
 
-    def ok_item(x: str) -> bool:
-        xl = x.lower()
-        if any(c in xl for c in cart_lower):
-            return False
-        return True
+    lowered = [it.lower() for it in menu_items]  # once per item, shared by both checks
 
-    for p in prefer:
-        for it in menu_items:
-            if len(picked) >= 3:
-                break
-            if p in it.lower() and ok_item(it) and it not in picked:
-                picked.append(it)
+    def ok_item(idx: int) -> bool:
+        # carts hold a handful of names: a plain any() beats building a scanner per call
+        xl = lowered[idx]
+        return not any(c in xl for c in cart_lower)
+
+    # One scan per item: rank by the earliest preference it matches, then menu order
+    # (same order as looping preferences outer, items inner).
+    ranked: List[Tuple[int, int, str]] = []
+    for idx, it in enumerate(menu_items):
+        mask = _UPSELL_SCANNER.scan(lowered[idx])
+        if mask:
+            ranked.append(((mask & -mask).bit_length(), idx, it))
+    ranked.sort()
+
+    for _pref, idx, it in ranked:
         if len(picked) >= 3:
             break
+        if it not in picked_set and ok_item(idx):
+            picked.append(it)
+            picked_set.add(it)
 
     # fallback: any 3 not in cart
     if len(picked) < 3:
-        for it in menu_items:
+        for idx, it in enumerate(menu_items):
             if len(picked) >= 3:
                 break
-            if ok_item(it) and it not in picked:
+            if it not in picked_set and ok_item(idx):
                 picked.append(it)
+                picked_set.add(it)
 
     return picked[:3]
 
@@ -123,6 +155,22 @@ class OrderingSession:
         t = (user_text or "").strip().lower()
         r = (reply or "").strip()
 
+        # Computed at most once per call, whichever branches below need them.
+        _cart_lower: Optional[List[str]] = None
+        _menu_items: Optional[List[str]] = None
+
+        def cart_lower() -> List[str]:
+            nonlocal _cart_lower
+            if _cart_lower is None:
+                _cart_lower = _cart_item_names_lower(self.state)
+            return _cart_lower
+
+        def menu_items() -> List[str]:
+            nonlocal _menu_items
+            if _menu_items is None:
+                _menu_items = _menu_items_from_context(menu_context)
+            return _menu_items
+
         # 1) If we just provided a menu list, ALWAYS end with a question + keep it short.
         if self.state.phase2 == SessionPhase.MENU_PROVIDED:
             if not _contains_question(r):
@@ -135,7 +183,7 @@ class OrderingSession:
 
         # 2) If user says a weak acknowledgement after a menu, nudge selection.
         if self.state.phase2 == SessionPhase.MENU_PROVIDED:
-            if (lang == "nl" and t in _ACK_NL) or (lang != "nl" and t in _ACK_EN):
+            if _is_ack(lang, t):
                 if lang == "nl":
                     return "Top. Welke van die opties wil je proberen? Als je wilt kan ik je top 3 aanraden."
                 return "Great. Which one would you like? If you want, I can suggest a top 3."
@@ -146,11 +194,10 @@ class OrderingSession:
             ps = SessionPolicyState(lang=lang)
             ps.last_category = getattr(self.state, "last_category", None)
             ps.last_category_items = list(getattr(self.state, "last_category_items", []) or [])
-            full = _menu_items_from_context(menu_context)
-            pool, reason = restricted_recommendation_pool(ps, user_text, full)
+            pool, reason = restricted_recommendation_pool(ps, user_text, menu_items())
             if reason.startswith("sticky:") and is_followup_recommendation(user_text, lang):
-                cart_lower = _cart_item_names_lower(self.state)
-                picks = [x for x in pool if x.lower() not in cart_lower][:3]
+                cart = cart_lower()
+                picks = [x for x in pool if x.lower() not in cart][:3]
                 if picks:
                     if lang == "nl":
                         return f"Als aanrader uit deze categorie: {', '.join(picks)}. Welke zal ik voor je toevoegen?"
@@ -160,10 +207,8 @@ class OrderingSession:
 
         # 4) After cart pending: if user is vague (oké/ja), upsell deterministically.
         if self.state.phase2 == SessionPhase.CART_PENDING:
-            if (lang == "nl" and t in _ACK_NL) or (lang != "nl" and t in _ACK_EN):
-                items = _menu_items_from_context(menu_context)
-                cart_lower = _cart_item_names_lower(self.state)
-                upsell = _pick_simple_upsell(items, cart_lower, lang)
+            if _is_ack(lang, t):
+                upsell = _pick_simple_upsell(menu_items(), cart_lower(), lang)
                 if upsell:
                     if lang == "nl":
                         return f"Top. Wil je er iets bij, bijvoorbeeld: {', '.join(upsell)}?"
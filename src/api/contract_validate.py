@@ -1,18 +1,75 @@
 from __future__ import annotations
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from jsonschema import Draft202012Validator
+from typing import TYPE_CHECKING, Any, Callable, Tuple
+
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
 
 ARCH_DIR = Path(__file__).resolve().parents[2] / "architecture"
 SCHEMAS_DIR = ARCH_DIR / "schemas"
 
+# Validation backend (rollout switch):
+# - "jsonschema" (default): pure-Python Draft202012Validator, raises jsonschema.ValidationError
+# - "jsonschema_rs": Rust core, raises jsonschema_rs.ValidationError
+# - "fastjsonschema": generated Python per schema (drafts 4/6/7 keywords only)
+# - "auto": jsonschema_rs if installed, else jsonschema
+SCHEMA_BACKEND = (os.getenv("VOXERON_SCHEMA_BACKEND") or "jsonschema").strip().lower()
+
+@lru_cache(maxsize=None)
 def load_schema(rel_path: str) -> dict:
+    # Cached per path: schemas are immutable for the life of the process (treat as read-only)
     p = SCHEMAS_DIR / rel_path
     if not p.exists():
         raise FileNotFoundError(f"Schema not found: {p}")
     return json.loads(p.read_text(encoding="utf-8"))
 
-def validate_payload(schema_rel_path: str, payload: dict) -> None:
+@lru_cache(maxsize=None)
+def compiled_validator(schema_rel_path: str) -> Draft202012Validator:
+    # Schema itself is checked once here, not on every validate() call.
+    # jsonschema is imported on first use so importing this module stays cheap.
+    from jsonschema import Draft202012Validator
+
     schema = load_schema(schema_rel_path)
-    Draft202012Validator(schema).validate(payload)
+    Draft202012Validator.check_schema(schema)
+    return Draft202012Validator(schema)
+
+@lru_cache(maxsize=None)
+def _compile(schema_rel_path: str) -> Tuple[Callable[[Any], Any], Callable[[Any], bool]]:
+    """(validate, is_valid) for the configured backend; compiled once per schema."""
+    if SCHEMA_BACKEND in ("jsonschema_rs", "auto"):
+        try:
+            import jsonschema_rs
+        except ImportError:
+            if SCHEMA_BACKEND == "jsonschema_rs":
+                raise
+        else:
+            v = jsonschema_rs.Draft202012Validator(load_schema(schema_rel_path))
+            return v.validate, v.is_valid
+
+    if SCHEMA_BACKEND == "fastjsonschema":
+        import fastjsonschema
+
+        fn = fastjsonschema.compile(load_schema(schema_rel_path))
+
+        def is_valid(payload: Any) -> bool:
+            try:
+                fn(payload)
+            except fastjsonschema.JsonSchemaException:
+                return False
+            return True
+
+        return fn, is_valid
+
+    v = compiled_validator(schema_rel_path)
+    return v.validate, v.is_valid
+
+def validate_payload(schema_rel_path: str, payload: dict) -> None:
+    _compile(schema_rel_path)[0](payload)
+
+def is_valid_payload(schema_rel_path: str, payload: dict) -> bool:
+    # Hot-path yes/no check: no ValidationError objects are built
+    return _compile(schema_rel_path)[1](payload)
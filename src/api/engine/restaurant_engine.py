@@ -1,40 +1,48 @@
 from __future__ import annotations
-from typing import Any, List
+from typing import Any, FrozenSet, List
 from .types import ResponsePlan, PlanAction
-from ..intent import norm_simple
+from ..intent import TextLike, Utterance, as_utterance
 from ..policy import nan_variant_question
 
+# tenant-config later; simple default for now
+_TOP3_LAMB = ("Lamb Dhansak", "Lamb Biryani", "Lamb Korma")
+
+
+# Display names on the menu; cached per snapshot via MenuSnapshot.derived()
+def _available_names(menu: Any) -> FrozenSet[str]:
+    return frozenset(menu.display_name(iid) for _n, iid in getattr(menu, "name_choices", []))
+
+
 class RestaurantEngine:
-    def _looks_like_question(self, text: str) -> bool:
-        raw = (text or "").strip()
-        tn = norm_simple(raw)
+    def _looks_like_question(self, u: Utterance) -> bool:
+        raw = u.raw.strip()
+        tn = u.norm
         if not tn:
             return False
         if "?" in raw:
             return True
         return any(w in tn for w in ["which", "what", "welke", "wat", "hoe", "variety", "soorten", "wat voor"])
 
-    def _is_spicy_query(self, text: str) -> bool:
-        t = norm_simple(text)
+    def _is_spicy_query(self, u: Utterance) -> bool:
+        t = u.norm
         return any(x in t for x in ["spicy", "very spicy", "hot", "heet", "pittig", "heel pittig"])
 
     def _top3_lamb(self, state: Any) -> List[str]:
-        # tenant-config later; simple default for now
-        ranked = ["Lamb Dhansak", "Lamb Biryani", "Lamb Korma"]
         # Only keep items that exist in menu, if menu is available
         menu = getattr(state, "menu", None)
         if not menu:
-            return ranked
-        available = {menu.display_name(iid) for _n, iid in getattr(menu, "name_choices", [])}
-        return [x for x in ranked if x in available] or ranked
+            return list(_TOP3_LAMB)
+        available = menu.derived("available_names", _available_names)
+        return [x for x in _TOP3_LAMB if x in available] or list(_TOP3_LAMB)
 
-    def plan(self, state: Any, transcript: str) -> ResponsePlan:
+    def plan(self, state: Any, transcript: TextLike) -> ResponsePlan:
         st = state
-        tnorm = norm_simple(transcript)
+        u = as_utterance(transcript)
+        tnorm = u.norm
 
         # 1) Pending naan variant: answer spicy question + reprompt
         if getattr(st, "pending_choice", None) == "nan_variant" and getattr(st, "menu", None):
-            if self._is_spicy_query(transcript) or self._looks_like_question(transcript):
+            if self._is_spicy_query(u) or self._looks_like_question(u):
                 if st.lang == "nl":
                     info = ("Naans zijn meestal niet pittig, het is brood om pittige curry te balanceren. "
                             "Keema naan kan wat kruidiger zijn, peshawari is juist wat zoeter.")
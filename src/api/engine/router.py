@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Any
+from typing import Any, Callable, Dict
+from ..intent import TextLike, as_utterance
 from .types import ResponsePlan
 from .restaurant_engine import RestaurantEngine
 from .dispatcher_engine import DispatcherEngine
@@ -8,12 +9,16 @@ class DomainRouter:
     def __init__(self):
         self.dispatcher = DispatcherEngine()
         self.restaurant = RestaurantEngine()
+        # phase -> engine.plan, bound once; phases not listed go to the restaurant engine
+        self._routes: Dict[str, Callable[[Any, TextLike], ResponsePlan]] = {
+            "dispatcher": self.dispatcher.plan,
+        }
 
-    def plan(self, state: Any, transcript: str) -> ResponsePlan:
-        # If we're in dispatcher phase, route there
-        if getattr(state, "phase", "") == "dispatcher":
-            return self.dispatcher.plan(state, transcript)
+    def plan(self, state: Any, transcript: TextLike) -> ResponsePlan:
+        handler = self._routes.get(getattr(state, "phase", "") or "")
+        if handler is not None:
+            return handler(state, transcript)
 
-        # Default (Taj demo): restaurant engine
-        return self.restaurant.plan(state, transcript)
+        # Default (Taj demo): restaurant engine; normalize the turn once for all detectors
+        return self.restaurant.plan(state, as_utterance(transcript))
 
@@ -11,7 +11,7 @@ class PlanAction(str, Enum):
     NOOP = "noop"                 # do nothing (e.g., incomplete utterance)
     END_CALL = "end_call"
 
-@dataclass
+@dataclass(slots=True)
 class ResponsePlan:
     action: PlanAction = PlanAction.REPLY
     reply: str = ""
@@ -3,7 +3,14 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Optional, Set, List
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple, Union
+
+# pyahocorasick is optional: without it MarkerScanner falls back to substring checks.
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None  # type: ignore
 
 
 @dataclass(frozen=True)
@@ -14,20 +21,115 @@ class LangDecision:
     explicit: bool                 # explicit vs implicit
 
 
+# ASCII punctuation/symbols -> space (one C-level translate pass)
+_ASCII_PUNCT_TO_SPACE = str.maketrans({
+    chr(c): " " for c in range(128) if not (chr(c).isalnum() or chr(c).isspace())
+})
+# Same rule for non-ASCII text: \w is isalnum() plus "_", \s is isspace()
+_NON_ALNUM_RE = re.compile(r"[^\w\s]|_")
+
+
+@lru_cache(maxsize=512)
 def norm_simple(s: str) -> str:
     """
     Lowercase + remove punctuation => spaces + collapse whitespace.
-    Good for intent detection.
+    Good for intent detection. Cached: successive detectors normalize the same turn.
     """
     s = (s or "").lower()
-    cleaned = []
-    for ch in s:
-        cleaned.append(ch if (ch.isalnum() or ch.isspace()) else " ")
-    return " ".join("".join(cleaned).split()).strip()
+    if s.isascii():
+        s = s.translate(_ASCII_PUNCT_TO_SPACE)
+    else:
+        s = _NON_ALNUM_RE.sub(" ", s)
+    return " ".join(s.split())
+
+
+_DEVANAGARI_RE = re.compile("[\u0900-\u097F]")
 
 
 def contains_devanagari(s: str) -> bool:
-    return any("\u0900" <= ch <= "\u097F" for ch in (s or ""))
+    s = s or ""
+    # ASCII check and regex search are both C-level scans (no per-char Python loop)
+    return not s.isascii() and _DEVANAGARI_RE.search(s) is not None
+
+
+@dataclass(frozen=True)
+class Utterance:
+    """One user turn, normalized once and shared by all detectors."""
+    raw: str
+    norm: str                      # norm_simple(raw)
+    tokens: Tuple[str, ...]        # norm.split()
+    tokset: FrozenSet[str]
+    has_devanagari: bool           # contains_devanagari(raw)
+
+
+def make_utterance(text: str) -> Utterance:
+    raw = text or ""
+    norm = norm_simple(raw)
+    tokens = tuple(norm.split())
+    return Utterance(
+        raw=raw,
+        norm=norm,
+        tokens=tokens,
+        tokset=frozenset(tokens),
+        has_devanagari=contains_devanagari(raw),
+    )
+
+
+# Detectors accept either the raw transcript or a prebuilt Utterance
+TextLike = Union[str, Utterance]
+
+
+def as_utterance(text: TextLike) -> Utterance:
+    return text if isinstance(text, Utterance) else make_utterance(text)
+
+
+class MarkerScanner:
+    """
+    One pass over a normalized utterance for many marker groups.
+    scan(t) returns a bitmask: bits[group] is set iff some marker of that group
+    occurs in t as a substring (same semantics as `any(m in t for m in markers)`).
+    Results are cached per text, so several detectors on one turn share a scan.
+    Without pyahocorasick each group is one compiled alternation regex (one C-level
+    search per group instead of one `in` probe per marker).
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        self.bits: Dict[str, int] = {name: 1 << i for i, name in enumerate(groups)}
+        self._groups = tuple((self.bits[name], tuple(markers)) for name, markers in groups.items())
+
+        self._automaton = None
+        self._patterns = ()
+        if ahocorasick is None:
+            # longest first: longer alternatives are tried first at each position
+            self._patterns = tuple(
+                (bit, re.compile("|".join(map(re.escape, sorted(set(markers), key=lambda m: (-len(m), m))))))
+                for bit, markers in self._groups
+                if markers
+            )
+        else:
+            masks: Dict[str, int] = {}
+            for bit, markers in self._groups:
+                for m in markers:
+                    masks[m] = masks.get(m, 0) | bit
+            automaton = ahocorasick.Automaton()
+            for m, mask in masks.items():
+                automaton.add_word(m, mask)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+        self.scan = lru_cache(maxsize=64)(self._scan)
+
+    def _scan(self, t: str) -> int:
+        mask = 0
+        if self._automaton is not None:
+            # reports every (overlapping) occurrence in one left-to-right pass
+            for _end, m in self._automaton.iter(t):
+                mask |= m
+            return mask
+        for bit, pattern in self._patterns:
+            if pattern.search(t) is not None:
+                mask |= bit
+        return mask
 
 
 # -------------------------
@@ -35,7 +137,7 @@ def contains_devanagari(s: str) -> bool:
 # -------------------------
 
 # Order summary, cart overview
-_NL_ORDER_SUMMARY_MARKERS: List[str] = [
+_NL_ORDER_SUMMARY_MARKERS: Tuple[str, ...] = (
     "mijn bestelling",
     "wat heb ik besteld",
     "wat is mijn bestelling",
@@ -45,8 +147,8 @@ _NL_ORDER_SUMMARY_MARKERS: List[str] = [
     "samenvatting",
     "mandje",
     "winkelmandje",
-]
-_EN_ORDER_SUMMARY_MARKERS: List[str] = [
+)
+_EN_ORDER_SUMMARY_MARKERS: Tuple[str, ...] = (
     "my order",
     "order summary",
     "what did i order",
@@ -55,7 +157,7 @@ _EN_ORDER_SUMMARY_MARKERS: List[str] = [
     "cart",
     "basket",
     "overview",
-]
+)
 
 # Category request and discovery
 _NL_MENU_CUES = ("menu", "op het menu", "hebben jullie", "wat hebben jullie", "welke", "wat zijn")
@@ -80,124 +182,138 @@ _NEG_TRIGGERS = (
 _MORE_MARKERS_NL = ("nog meer", "meer", "meer opties", "kun je meer", "wat nog meer", "meer noemen")
 _MORE_MARKERS_EN = ("more", "more options", "what else", "list more", "anything else")
 
+# Explicit remove/cancel
+_NL_REMOVE_MARKERS = (
+    "verwijder",
+    "haal weg",
+    "schrap",
+    "annuleer",
+    "niet meer",
+    "laat maar",
+    "kan weg",
+    "eraf",
+    "minus",
+)
+_EN_REMOVE_MARKERS = (
+    "remove",
+    "cancel",
+    "delete",
+    "take off",
+    "drop",
+    "minus",
+    "no longer",
+)
 
-def detect_order_summary_intent(text: str, lang: str) -> bool:
-    t = norm_simple(text)
+# Generic naan tokens (STT spellings); matched as whole tokens
+_NAN_KEYS = frozenset({"nan", "naan", "naam"})
+# Naan subtype already specified
+_NAN_VARIANT_MARKERS = ("garlic", "knoflook", "cheese", "kaas", "keema", "peshawari")
+
+# Category keywords (also count as a discovery cue)
+_CATEGORY_KEYWORDS = (
+    ("lamb", ("lam", "lamb")),
+    ("chicken", ("kip", "chicken")),
+    ("biryani", ("biryani",)),
+    ("vegetarian", ("vega", "vegetar", "vegetarian", "paneer")),
+)
+
+_SCANNER = MarkerScanner({
+    "nl_summary": _NL_ORDER_SUMMARY_MARKERS,
+    "en_summary": _EN_ORDER_SUMMARY_MARKERS,
+    "menu_cue": _NL_MENU_CUES + _EN_MENU_CUES,
+    "neg": _NEG_TRIGGERS,
+    "nl_more": _MORE_MARKERS_NL,
+    "en_more": _MORE_MARKERS_EN,
+    "nl_remove": _NL_REMOVE_MARKERS,
+    "en_remove": _EN_REMOVE_MARKERS,
+    "nan_variant": _NAN_VARIANT_MARKERS,
+    **dict(_CATEGORY_KEYWORDS),
+})
+_BITS = _SCANNER.bits
+_CATEGORY_BITS = tuple((cat, _BITS[cat]) for cat, _keys in _CATEGORY_KEYWORDS)
+_ANY_CATEGORY = sum(bit for _cat, bit in _CATEGORY_BITS)
+
+
+def detect_order_summary_intent(text: TextLike, lang: str) -> bool:
+    t = as_utterance(text).norm
     if not t:
         return False
     lang_n = (lang or "en").lower()
-    if lang_n == "nl":
-        return any(m in t for m in _NL_ORDER_SUMMARY_MARKERS)
-    return any(m in t for m in _EN_ORDER_SUMMARY_MARKERS)
+    return bool(_SCANNER.scan(t) & _BITS["nl_summary" if lang_n == "nl" else "en_summary"])
 
 
-def detect_more_intent(text: str, lang: str) -> bool:
-    t = norm_simple(text)
+def detect_more_intent(text: TextLike, lang: str) -> bool:
+    t = as_utterance(text).norm
     if not t:
         return False
     lang_n = (lang or "en").lower()
-    if lang_n == "nl":
-        return any(m in t for m in _MORE_MARKERS_NL)
-    return any(m in t for m in _MORE_MARKERS_EN)
+    return bool(_SCANNER.scan(t) & _BITS["nl_more" if lang_n == "nl" else "en_more"])
 
 
-def detect_negative_intent(text: str) -> bool:
+def detect_negative_intent(text: TextLike) -> bool:
     """
     Conservative: if any negative trigger appears anywhere, return True.
     SessionController should then avoid deterministic add and let LLM handle it
     or route to remove logic if you implement it.
     """
-    t = norm_simple(text)
+    t = as_utterance(text).norm
     if not t:
         return False
-    return any(m in t for m in _NEG_TRIGGERS)
+    return bool(_SCANNER.scan(t) & _BITS["neg"])
 
 
-def detect_explicit_remove_intent(text: str, lang: str) -> bool:
+def detect_explicit_remove_intent(text: TextLike, lang: str) -> bool:
     """
     True only when the user explicitly asked to remove/cancel something.
     This is stricter than detect_negative_intent().
     """
-    t = norm_simple(text)
+    t = as_utterance(text).norm
     if not t:
         return False
 
     lang_n = (lang or "en").lower()
+    return bool(_SCANNER.scan(t) & _BITS["nl_remove" if lang_n == "nl" else "en_remove"])
 
-    if lang_n == "nl":
-        remove_markers = (
-            "verwijder",
-            "haal weg",
-            "schrap",
-            "annuleer",
-            "niet meer",
-            "laat maar",
-            "kan weg",
-            "eraf",
-            "minus",
-        )
-    else:
-        remove_markers = (
-            "remove",
-            "cancel",
-            "delete",
-            "take off",
-            "drop",
-            "minus",
-            "no longer",
-        )
 
-    return any(m in t for m in remove_markers)
-
-
-def detect_generic_nan_request(text: str) -> bool:
+def detect_generic_nan_request(text: TextLike) -> bool:
     """
     Detects a generic request for nan/naan/naam without specifying a subtype.
     STT safe: catches nan/naan/naam.
     """
-    t = norm_simple(text)
+    u = as_utterance(text)
+    t = u.norm
     if not t:
         return False
 
-    toks = t.split()
-
     # must contain nan/naan/naam token-ish
-    has_nan = any(k in toks for k in ("nan", "naan", "naam"))
-    if not has_nan:
+    if _NAN_KEYS.isdisjoint(u.tokset):
         return False
 
     # if user already specified a variant, it's NOT generic
-    variant_markers = ("garlic", "knoflook", "cheese", "kaas", "keema", "peshawari")
-    if any(v in t for v in variant_markers):
+    if _SCANNER.scan(t) & _BITS["nan_variant"]:
         return False
 
     return True
 
 
-def detect_category_request(text: str) -> Optional[str]:
+def detect_category_request(text: TextLike) -> Optional[str]:
     """
     Very cheap category detection. Returns canonical category key or None.
     Keep conservative, no ML, just token cues.
     """
-    t = norm_simple(text)
+    t = as_utterance(text).norm
     if not t:
         return None
 
-    # A cue that user is asking discovery or menu question
-    cue = any(c in t for c in _NL_MENU_CUES) or any(c in t for c in _EN_MENU_CUES)
-    if not cue:
-        cue = True if any(k in t for k in ("lam", "lamb", "kip", "chicken", "biryani", "vega", "vegetar", "vegetarian", "paneer")) else False
-    if not cue:
+    mask = _SCANNER.scan(t)
+
+    # A cue that user is asking discovery or menu question (a category keyword also counts)
+    if not mask & (_BITS["menu_cue"] | _ANY_CATEGORY):
         return None
 
-    if any(k in t for k in ("lam", "lamb")):
-        return "lamb"
-    if any(k in t for k in ("kip", "chicken")):
-        return "chicken"
-    if "biryani" in t:
-        return "biryani"
-    if any(k in t for k in ("vega", "vegetar", "vegetarian", "paneer")):
-        return "vegetarian"
+    for cat, bit in _CATEGORY_BITS:
+        if mask & bit:
+            return cat
     return None
 
 
@@ -205,29 +321,37 @@ def detect_category_request(text: str) -> Optional[str]:
 # Language switching (INERTIA)
 # -------------------------
 
-def infer_user_language(text: str) -> Optional[str]:
+_DUTCH_MARKERS = frozenset({"ik", "wil", "graag", "alsjeblieft", "alstublieft", "twee", "geen", "maar", "met", "zonder", "en"})
+
+_DUTCH_LANG_TOKENS = frozenset({"nederlands", "dutch", "nederland", "nederlandse", "nederlandsche", "netherlands"})
+_EN_LANG_TOKENS = frozenset({"english", "engels"})
+_LANG_TOKENS = _DUTCH_LANG_TOKENS | _EN_LANG_TOKENS
+
+_LANG_INTENT_WORDS = frozenset({
+    "switch", "naar", "spreek", "speak", "taal", "language", "in",
+    "wil", "want", "liever", "prefer", "please", "alsjeblieft", "alstublieft",
+    "doen", "kan", "kunnen",
+})
+
+
+def infer_user_language(text: TextLike) -> Optional[str]:
     """
     Implicit language markers. Keep conservative.
     EN/NL-only policy: we only infer Dutch implicitly during language_select.
     """
-    if not text:
-        return None
-
-    t = norm_simple(text)
-    if not t:
+    u = as_utterance(text)
+    if not u.norm:
         return None
-    toks = set(t.split())
+    toks = u.tokset
 
-    dutch_markers = {"ik", "wil", "graag", "alsjeblieft", "alstublieft", "twee", "geen", "maar", "met", "zonder", "en"}
-
-    if len(toks & dutch_markers) >= 3:
+    if len(toks & _DUTCH_MARKERS) >= 3:
         return "nl"
 
     return None
 
 
 def detect_language_intent(
-    transcript: str,
+    transcript: TextLike,
     *,
     phase: str,
     current_lang: str,
@@ -244,49 +368,38 @@ def detect_language_intent(
       - Do NOT flip language in-chat based on single tokens like "ja".
       - Hindi is disabled.
     """
-    raw = transcript or ""
-    t = norm_simple(raw)
-    if not t:
+    u = as_utterance(transcript)
+    if not u.norm:
         return LangDecision(None, "low", "empty transcript", False)
 
-    toks = t.split()
-    tokset: Set[str] = set(toks)
-
-    DUTCH_TOKENS = {"nederlands", "dutch", "nederland", "nederlandse", "nederlandsche", "netherlands"}
-    EN_TOKENS = {"english", "engels"}
-
-    INTENT_WORDS = {
-        "switch", "naar", "spreek", "speak", "taal", "language", "in",
-        "wil", "want", "liever", "prefer", "please", "alsjeblieft", "alstublieft",
-        "doen", "kan", "kunnen",
-    }
+    toks = u.tokens
+    tokset = u.tokset
 
     def looks_like_language_pick() -> bool:
         if len(toks) <= 5:
             return True
         if "switch" in tokset or "naar" in tokset:
             return True
-        if (tokset & INTENT_WORDS) and (tokset & (DUTCH_TOKENS | EN_TOKENS)):
-            return True
-        if "in" in tokset and (tokset & (DUTCH_TOKENS | EN_TOKENS)):
+        # "in" is itself an intent word, so this also covers "in english"
+        if not _LANG_INTENT_WORDS.isdisjoint(tokset) and not _LANG_TOKENS.isdisjoint(tokset):
             return True
         return False
 
     # Hindi hard-disabled
-    if contains_devanagari(raw) and looks_like_language_pick():
+    if u.has_devanagari and looks_like_language_pick():
         return LangDecision(None, "high", "Devanagari detected but Hindi is disabled", True)
 
     # Explicit token-based picks
-    if (tokset & DUTCH_TOKENS) and looks_like_language_pick():
+    if not _DUTCH_LANG_TOKENS.isdisjoint(tokset) and looks_like_language_pick():
         return LangDecision("nl", "high", "Dutch token + pick intent", True)
-    if (tokset & EN_TOKENS) and looks_like_language_pick():
+    if not _EN_LANG_TOKENS.isdisjoint(tokset) and looks_like_language_pick():
         return LangDecision("en", "high", "English token + pick intent", True)
 
     # Implicit detection (ONLY at language_select)
     if allow_auto_detect and phase == "language_select":
-        imp = infer_user_language(raw)
-        if imp:
-            return LangDecision(imp, "med", "implicit language markers during language_select", False)
+        # same rule as infer_user_language(), on the tokens we already have
+        if len(tokset & _DUTCH_MARKERS) >= 3:
+            return LangDecision("nl", "med", "implicit language markers during language_select", False)
 
     return LangDecision(None, "low", "no language intent detected", False)
 
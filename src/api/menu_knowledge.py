@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from .intent import norm_simple
+from .intent import MarkerScanner, TextLike, as_utterance
 from .menu_store import MenuSnapshot
 
 
@@ -29,73 +29,78 @@ _PROTEIN_HINTS = {
 }
 
 
-def extract_traits(text: str) -> TraitQuery:
-    t = norm_simple(text)
+_TRAIT_SCANNER = MarkerScanner({"spicy": _SPICY_WORDS, **_PROTEIN_HINTS})
+_TRAIT_BITS = _TRAIT_SCANNER.bits
+
+
+def extract_traits(text: TextLike) -> TraitQuery:
+    t = as_utterance(text).norm
     q = TraitQuery(raw=t)
+    mask = _TRAIT_SCANNER.scan(t)
 
-    if any(w in t for w in _SPICY_WORDS):
+    if mask & _TRAIT_BITS["spicy"]:
         q.wants_spicy = True
 
-    for protein, keys in _PROTEIN_HINTS.items():
-        if any(k in t for k in keys):
+    for protein in _PROTEIN_HINTS:
+        if mask & _TRAIT_BITS[protein]:
             q.protein = protein
             break
 
     return q
 
 
+_PROTEIN_RULES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("lamb", ("lamb", "lam")),
+    ("chicken", ("chicken", "kip")),
+    ("biryani", ("biryani",)),
+    ("vegetarian", ("veg", "veget", "paneer", "dahl", "dal")),
+)
+
+def _build_protein_index(menu: MenuSnapshot) -> Dict[str, List[str]]:
+    """protein -> deduped display names."""
+    index: Dict[str, List[str]] = {p: [] for p, _ in _PROTEIN_RULES}
+    seen: Dict[str, set] = {p: set() for p, _ in _PROTEIN_RULES}
+    # display_names_lower is filled in step with name_choices when the snapshot is built
+    for (_norm_name, iid), l in zip(menu.name_choices, menu.display_names_lower):
+        dn = menu.display_name_safe(iid)
+        if dn is None:
+            continue
+        dn = dn.strip()
+        for protein, words in _PROTEIN_RULES:
+            if dn not in seen[protein] and any(w in l for w in words):
+                seen[protein].add(dn)
+                index[protein].append(dn)
+    return index
+
+
 def list_items_for_protein(menu: MenuSnapshot, protein: str) -> List[str]:
     """
     MVP fallback: name heuristics (used if metadata isn't available).
+    Built once per menu snapshot (snapshots are immutable once loaded).
     """
-    out: List[str] = []
-    for _norm_name, iid in menu.name_choices:
-        try:
-            dn = (menu.display_name(iid) or "").strip()
-        except Exception:
-            continue
-        l = dn.lower()
-
-        if protein == "lamb":
-            if "lamb" in l or "lam" in l:
-                out.append(dn)
-        elif protein == "chicken":
-            if "chicken" in l or "kip" in l:
-                out.append(dn)
-        elif protein == "biryani":
-            if "biryani" in l:
-                out.append(dn)
-        elif protein == "vegetarian":
-            if any(x in l for x in ["veg", "veget", "paneer", "dahl", "dal"]):
-                out.append(dn)
-
-    seen = set()
-    dedup = []
-    for x in out:
-        if x not in seen:
-            seen.add(x)
-            dedup.append(x)
-
-    return dedup[:80]
+    return menu.derived("protein_index", _build_protein_index).get(protein, [])[:80]
+
+
+# (keywords, score): a name scores each row once if any of its keywords occurs
+_SPICE_TABLE: Tuple[Tuple[Tuple[str, ...], int], ...] = (
+    (("phall",), 100),
+    (("vindaloo",), 80),
+    (("madras",), 70),
+    (("jalfrezi",), 60),
+    (("karahi",), 55),
+    (("bhuna",), 45),
+    (("chilli", "chili"), 40),
+)
 
 
 def _spice_score(name: str) -> int:
     n = (name or "").lower()
     score = 0
-    if "phall" in n:
-        score += 100
-    if "vindaloo" in n:
-        score += 80
-    if "madras" in n:
-        score += 70
-    if "jalfrezi" in n:
-        score += 60
-    if "karahi" in n:
-        score += 55
-    if "bhuna" in n:
-        score += 45
-    if "chilli" in n or "chili" in n:
-        score += 40
+    for words, pts in _SPICE_TABLE:
+        for w in words:
+            if w in n:
+                score += pts
+                break
     return score
 
 
@@ -149,13 +154,12 @@ def suggest_substitution(
         return None, 0.0, "fallback:no-candidates"
 
     if q.wants_spicy:
-        ranked = sorted(candidates, key=_spice_score, reverse=True)
-        top = ranked[0]
+        # max() keeps the first of equal scores, same as the stable reverse sort did
+        top = max(candidates, key=_spice_score)
         top_score = _spice_score(top)
         if top_score >= 55:
             return top, 0.75, "fallback:protein+spicy-keyword"
         return None, 0.65, "fallback:protein-but-spice-uncertain"
 
-    ranked = sorted(candidates, key=lambda x: (len(x), x))
-    return ranked[0], 0.65, "fallback:protein-only"
+    return min(candidates, key=lambda x: (len(x), x)), 0.65, "fallback:protein-only"
 
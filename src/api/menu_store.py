@@ -1,11 +1,17 @@
 # src/api/menu_store.py
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
+import re
+import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple, Any
 
 from ..db.database import db  # ✅ reuse your existing global Database() instance
 from .text import norm_text
@@ -14,21 +20,71 @@ logger = logging.getLogger(__name__)
 
 _GENERIC_NAAN_ALIASES = {"naan", "nan", "naam"}
 
+# NOTIFY channel published by the menu triggers (sql/menu_changed_notify.sql); payload = tenant_id
+MENU_CHANGED_CHANNEL = "menu_changed"
+# Retry LISTEN at most this often after the listener connection drops
+_LISTEN_RETRY_S = 30.0
+# Unknown tenant_ref results are remembered this long (bounded LRU)
+_NEG_CACHE_TTL_S = 30.0
+_NEG_CACHE_MAX = 1024
 
-def _is_flavored_naan_item_name(name_norm: str) -> bool:
-    return any(x in name_norm for x in ("garlic", "cheese", "keema", "peshawari", "butter", "boter", "knoflook"))
 
+_FLAVORED_NAAN_RE = re.compile(r"garlic|cheese|keema|peshawari|butter|boter|knoflook")
 
-def _prefer_new_generic_naan_mapping(existing_name: str, new_name: str) -> bool:
-    # Prefer mapping generic "naan/nan/naam" to the plain/regular naan (if present)
-    if not _is_flavored_naan_item_name(existing_name):
-        return False
-    if not _is_flavored_naan_item_name(new_name):
-        return True
-    return False
 
+def _is_flavored_naan_item_name(name_norm: str) -> bool:
+    return _FLAVORED_NAAN_RE.search(name_norm) is not None
 
-@dataclass
+
+def _prefer_new_generic_naan_mapping(existing_flavored: bool, new_flavored: bool) -> bool:
+    # Prefer mapping generic "naan/nan/naam" to the plain/regular naan (if present)
+    return existing_flavored and not new_flavored
+
+
+# Whole snapshot as one JSON document; formatted per (schema, language) in MenuStore.__init__
+_SNAPSHOT_SQL = """
+    WITH t AS (
+        SELECT tenant_id, name, default_language
+        FROM {schema}.tenants
+        WHERE tenant_ref = $1
+    ),
+    items AS (
+        SELECT
+            i.item_id,
+            i.{name_col} AS name,
+            i.{desc_col} AS description,
+            i.price_pickup,
+            i.price_delivery,
+            i.category_id,
+            i.is_available,
+            -- only the two tag fields the builder reads are decoded per row
+            CASE WHEN jsonb_typeof(i.tags -> 'keywords') = 'string'
+                 THEN i.tags ->> 'keywords' END AS tag_keywords,
+            CASE WHEN jsonb_typeof(i.tags -> 'aliases') = 'array'
+                 THEN i.tags -> 'aliases' END AS tag_aliases,
+            i.tags::text AS tags_raw,
+            i.customizable_spice,
+            i.default_spice_level
+        FROM {schema}.menu_items i
+        JOIN t ON i.tenant_id = t.tenant_id
+        WHERE i.is_available = TRUE
+    ),
+    aliases AS (
+        SELECT a.item_id, a.alias_text
+        FROM {schema}.menu_item_aliases a
+        JOIN t ON a.tenant_id = t.tenant_id
+    )
+    SELECT json_build_object(
+        'tenant', row_to_json(t),
+        'items', (SELECT json_agg(items) FROM items),
+        'aliases', (SELECT json_agg(aliases) FROM aliases)
+    )::text
+    FROM t
+"""
+_LANG_COLUMNS = {"en": ("name_en", "description_en"), "nl": ("name_nl", "description_nl")}
+
+
+@dataclass(slots=True)
 class MenuItem:
     item_id: str
     name: str
@@ -37,9 +93,26 @@ class MenuItem:
     price_delivery: float
     category_id: Optional[int]
     is_available: bool
-    tags: Dict[str, Any]
+    tags_raw: Optional[str]  # tags JSON as text; decoded on first .tags access
     customizable_spice: Optional[bool] = None
     default_spice_level: Optional[str] = None
+    name_norm: str = field(init=False, repr=False)  # norm_text(name), computed once
+    flavored_naan: bool = field(init=False, repr=False)  # garlic/cheese/... naan name, computed once
+    _tags: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.name_norm = norm_text(self.name)
+        self.flavored_naan = _is_flavored_naan_item_name(self.name_norm)
+
+    @property
+    def tags(self) -> Dict[str, Any]:
+        if self._tags is None:
+            try:
+                tags = json.loads(self.tags_raw) if self.tags_raw else {}
+            except ValueError:
+                tags = {}
+            self._tags = tags if isinstance(tags, dict) else {}
+        return self._tags
 
 
 @dataclass
@@ -48,14 +121,30 @@ class MenuSnapshot:
     tenant_name: str
     default_language: str = "english"
 
+    # Built once by MenuStore and then only read: sequences are tuples, alias_map a read-only view
     items_by_id: Dict[str, MenuItem] = field(default_factory=dict)
-    name_choices: List[Tuple[str, str]] = field(default_factory=list)  # (norm_name, item_id)
-    alias_map: Dict[str, str] = field(default_factory=dict)           # norm_alias -> item_id
+    name_choices: Sequence[Tuple[str, str]] = field(default_factory=tuple)  # (norm_name, item_id)
+    display_names_lower: Sequence[str] = field(default_factory=tuple)       # parallel to name_choices
+    alias_map: Mapping[str, str] = field(default_factory=dict)              # norm_alias -> item_id
+    _derived: Dict[Hashable, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def display_name(self, item_id: str) -> str:
         it = self.items_by_id.get(item_id)
         return it.name if it else item_id
 
+    def display_name_safe(self, item_id: str, default: Optional[str] = None) -> Optional[str]:
+        """Like display_name(), but returns `default` for unknown ids instead of the id."""
+        it = self.items_by_id.get(item_id)
+        return it.name if it else default
+
+    def derived(self, key: Hashable, build: Callable[["MenuSnapshot"], Any]) -> Any:
+        """Value of `build(self)`, computed on first use and kept for the life of this snapshot."""
+        try:
+            return self._derived[key]
+        except KeyError:
+            value = self._derived[key] = build(self)
+            return value
+
 
 class MenuStore:
     """
@@ -65,12 +154,46 @@ class MenuStore:
       - tenants: tenant_id, tenant_ref, name, default_language
       - menu_items: name_en/name_nl, description_en/description_nl, tags, etc.
       - menu_item_aliases: item_id, alias_text, tenant_id (lang may exist, but not required)
+
+    Caching is stale-while-revalidate:
+      - younger than ttl_seconds: served as-is
+      - older: still served, refreshed in the background (one refresh per key)
+      - older than max_stale_seconds: reloaded inline (safety ceiling)
+    Menu writes invalidate precisely via LISTEN menu_changed (see sql/menu_changed_notify.sql);
+    the TTLs are the backstop for notifications missed while the listener is down.
     """
 
-    def __init__(self, database_url: str = "", ttl_seconds: int = 180, schema: str = "public"):
+    def __init__(
+        self,
+        database_url: str = "",
+        ttl_seconds: int = 180,
+        schema: str = "public",
+        max_stale_seconds: int = 900,
+    ):
         self.schema = schema or "public"
         self.ttl_seconds = int(ttl_seconds or 180)
+        self.max_stale_seconds = max(int(max_stale_seconds or 900), self.ttl_seconds)
         self._cache: Dict[Tuple[str, str], Tuple[float, MenuSnapshot]] = {}
+        self._refreshing: Dict[Tuple[str, str], asyncio.Task] = {}
+        # (tenant_ref, lang) -> expires_at for refs that resolved to no tenant
+        self._neg_cache: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        # Bumped on every invalidation; loads started before a bump don't populate the cache
+        self._generation = 0
+
+        self._listen_conn: Any = None
+        self._listen_enabled = False
+        self._listen_retry_at = 0.0
+        self._listen_task: Optional[asyncio.Task] = None
+
+        # Fixed SQL per language, prepared once per pooled connection (db.prepared)
+        self._snapshot_stmt: Dict[str, str] = {}
+        for lang_n, (name_col, desc_col) in _LANG_COLUMNS.items():
+            stmt_name = f"menu_snapshot:{self.schema}:{lang_n}"
+            db.register_statement(
+                stmt_name,
+                _SNAPSHOT_SQL.format(schema=self.schema, name_col=name_col, desc_col=desc_col),
+            )
+            self._snapshot_stmt[lang_n] = stmt_name
 
         # If a DATABASE_URL is passed, ensure env matches what src/db/database.py expects.
         if database_url and not os.getenv("DATABASE_URL"):
@@ -79,151 +202,228 @@ class MenuStore:
     async def start(self) -> None:
         # Ensure pool is up
         await db.connect()
+        self._listen_enabled = True
+        await self._listen()
 
     async def close(self) -> None:
+        self._listen_enabled = False
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        self._refreshing.clear()
+        con, self._listen_conn = self._listen_conn, None
+        if con is not None:
+            try:
+                await con.close()
+            except Exception:
+                logger.exception("MenuStore: error closing listener connection")
         await db.close()
 
+    # -------------------------
+    # Invalidation (LISTEN/NOTIFY)
+    # -------------------------
+
+    async def _listen(self) -> None:
+        """Hold one dedicated connection LISTENing on menu_changed. Never raises."""
+        self._listen_retry_at = time.time() + _LISTEN_RETRY_S
+        try:
+            con = await db.single_connect()
+            await con.add_listener(MENU_CHANGED_CHANNEL, self._on_menu_changed)
+            con.add_termination_listener(self._on_listen_terminated)
+        except Exception as e:
+            logger.warning("MenuStore: LISTEN %s unavailable (%s); relying on TTL", MENU_CHANGED_CHANNEL, e)
+            return
+        self._listen_conn = con
+        # anything cached while we were not listening may have missed a notification
+        self.invalidate()
+        logger.info("MenuStore: listening on %s", MENU_CHANGED_CHANNEL)
+
+    def _on_listen_terminated(self, _con: Any) -> None:
+        logger.warning("MenuStore: listener connection closed; relying on TTL until it reconnects")
+        self._listen_conn = None
+
+    def _on_menu_changed(self, _con: Any, _pid: int, _channel: str, payload: str) -> None:
+        self.invalidate((payload or "").strip() or None)
+
+    def invalidate(self, tenant_id: Optional[str] = None) -> None:
+        """Drop cached snapshots for one tenant (all tenants if None)."""
+        self._generation += 1
+        if tenant_id is None:
+            self._cache.clear()
+            self._neg_cache.clear()
+            return
+        for key in [k for k, (_ts, snap) in self._cache.items() if snap.tenant_id == tenant_id]:
+            self._cache.pop(key, None)
+
+    # -------------------------
+    # Snapshots
+    # -------------------------
+
     async def get_snapshot(self, tenant_ref: str, lang: str = "en") -> Optional[MenuSnapshot]:
         now = time.time()
+        if self._listen_enabled and self._listen_conn is None and now >= self._listen_retry_at:
+            # reconnect off the request path
+            self._listen_retry_at = now + _LISTEN_RETRY_S
+            self._listen_task = asyncio.create_task(self._listen())
+
         cache_key = (tenant_ref, lang)
+        if self._neg_cache.get(cache_key, 0.0) > now:
+            return None
         cached = self._cache.get(cache_key)
-        if cached and (now - cached[0]) < self.ttl_seconds:
-            return cached[1]
+        if cached:
+            age = now - cached[0]
+            if age < self.ttl_seconds:
+                return cached[1]
+            if age < self.max_stale_seconds:
+                if cache_key not in self._refreshing:
+                    self._refreshing[cache_key] = asyncio.create_task(self._refresh(cache_key))
+                return cached[1]
+
+        return await self._load(tenant_ref, lang)
+
+    async def _refresh(self, cache_key: Tuple[str, str]) -> None:
+        try:
+            if await self._load(*cache_key) is None:
+                self._cache.pop(cache_key, None)
+        except Exception:
+            logger.exception("MenuStore: background refresh failed for %s", cache_key)
+        finally:
+            self._refreshing.pop(cache_key, None)
+
+    async def _load(self, tenant_ref: str, lang: str) -> Optional[MenuSnapshot]:
+        """Build a fresh snapshot from the DB and cache it (unless invalidated meanwhile)."""
+        generation = self._generation
+        loaded_at = time.time()
+        cache_key = (tenant_ref, lang)
 
         await db.connect()
         assert db.pool is not None
 
+        lang_n = "nl" if (lang or "en").lower() == "nl" else "en"
+
+        # tenant + items + aliases in one round trip (each hop to Neon is expensive)
         async with db.pool.acquire() as conn:
-            tenant = await conn.fetchrow(
-                f"""
-                SELECT tenant_id, name, default_language
-                FROM {self.schema}.tenants
-                WHERE tenant_ref = $1
-                """,
-                tenant_ref,
+            stmt = await db.prepared(conn, self._snapshot_stmt[lang_n])
+            raw = await stmt.fetchval(tenant_ref)
+        if not raw:
+            self._neg_cache[cache_key] = time.time() + _NEG_CACHE_TTL_S
+            self._neg_cache.move_to_end(cache_key)
+            if len(self._neg_cache) > _NEG_CACHE_MAX:
+                self._neg_cache.popitem(last=False)
+            return None
+
+        data = json.loads(raw)
+        tenant = data["tenant"]
+        rows = data.get("items") or []
+        alias_rows = data.get("aliases") or []
+
+        # built in locals, frozen into the snapshot at the end
+        items_by_id: Dict[str, MenuItem] = {}
+        alias_map: Dict[str, str] = {}
+        name_choices: List[Tuple[str, str]] = []
+        display_names_lower: List[str] = []
+        # (raw alias, owner) in write order; normalized in one pass after the scans
+        alias_raw: List[str] = []
+        alias_owner: List[MenuItem] = []
+
+        def _set_generic_naan_alias(alias_norm: str, item: MenuItem) -> None:
+            # avoid mapping "naan" -> garlic naan if plain exists
+            if item.flavored_naan:
+                return
+            existing = alias_map.get(alias_norm)
+            existing_item = items_by_id.get(existing) if existing else None
+            if existing_item is not None:
+                if not _prefer_new_generic_naan_mapping(existing_item.flavored_naan, item.flavored_naan):
+                    return
+            alias_map[alias_norm] = item.item_id
+
+        for r in rows:
+            # interned: every alias of this item (and the other-language snapshot) shares one id object
+            item_id = sys.intern(str(r["item_id"]))
+            name = (r["name"] or "").strip() or item_id
+            description = (r["description"] or "").strip()
+
+            # each column read once; rows always carry every selected key (json_agg of the CTE)
+            category_id = r["category_id"]
+            customizable_spice = r["customizable_spice"]
+            default_spice_level = r["default_spice_level"]
+
+            item = MenuItem(
+                item_id=item_id,
+                name=name,
+                description=description,
+                price_pickup=float(r["price_pickup"] or 0),
+                price_delivery=float(r["price_delivery"] or 0),
+                category_id=int(category_id) if category_id is not None else None,
+                is_available=bool(r["is_available"]),
+                tags_raw=r["tags_raw"],
+                customizable_spice=bool(customizable_spice) if customizable_spice is not None else None,
+                default_spice_level=str(default_spice_level).strip() if default_spice_level else None,
             )
-            if not tenant:
-                return None
 
-            snap = MenuSnapshot(
-                tenant_id=str(tenant["tenant_id"]),
-                tenant_name=str(tenant["name"]),
-                default_language=str(tenant.get("default_language") or "english"),
-            )
+            items_by_id[item_id] = item
+            name_norm = item.name_norm
+            name_choices.append((name_norm, item_id))
+            display_names_lower.append(name.lower())
+
+            # name itself is an alias (already normalized; norm_text is idempotent)
+            alias_raw.append(name_norm)
+            alias_owner.append(item)
 
-            # pick language columns
-            lang_n = (lang or "en").lower()
+            # optional search keywords (DB columns exist)
+            kw = ""
             if lang_n == "nl":
-                name_col = "name_nl"
-                desc_col = "description_nl"
+                kw = (r.get("search_keywords_nl") or "")
             else:
-                name_col = "name_en"
-                desc_col = "description_en"
-
-            rows = await conn.fetch(
-                f"""
-                SELECT
-                    item_id,
-                    {name_col} AS name,
-                    {desc_col} AS description,
-                    price_pickup,
-                    price_delivery,
-                    category_id,
-                    is_available,
-                    tags,
-                    customizable_spice,
-                    default_spice_level
-                FROM {self.schema}.menu_items
-                WHERE tenant_id = $1 AND is_available = TRUE
-                """,
-                snap.tenant_id,
-            )
-
-            def _set_alias(alias_norm: str, item_id: str, item_name_norm: str) -> None:
-                if not alias_norm or len(alias_norm) < 3:
-                    return
-
-                if alias_norm in _GENERIC_NAAN_ALIASES:
-                    # avoid mapping "naan" -> garlic naan if plain exists
-                    if _is_flavored_naan_item_name(item_name_norm):
-                        return
-                    existing = snap.alias_map.get(alias_norm)
-                    if existing and existing in snap.items_by_id:
-                        existing_name = norm_text(snap.items_by_id[existing].name)
-                        if not _prefer_new_generic_naan_mapping(existing_name, item_name_norm):
-                            return
-
-                snap.alias_map[alias_norm] = item_id
-
-            for r in rows:
-                item_id = str(r["item_id"])
-                name = (r.get("name") or "").strip() or item_id
-                description = (r.get("description") or "").strip()
-
-                tags = r.get("tags") or {}
-                if not isinstance(tags, dict):
-                    tags = {}
-
-                item = MenuItem(
-                    item_id=item_id,
-                    name=name,
-                    description=description,
-                    price_pickup=float(r.get("price_pickup") or 0),
-                    price_delivery=float(r.get("price_delivery") or 0),
-                    category_id=int(r["category_id"]) if r.get("category_id") is not None else None,
-                    is_available=bool(r.get("is_available", True)),
-                    tags=tags,
-                    customizable_spice=bool(r.get("customizable_spice")) if r.get("customizable_spice") is not None else None,
-                    default_spice_level=(str(r.get("default_spice_level")).strip() if r.get("default_spice_level") else None),
-                )
-
-                snap.items_by_id[item_id] = item
-                name_norm = norm_text(name)
-                snap.name_choices.append((name_norm, item_id))
-
-                # name itself is an alias
-                _set_alias(name_norm, item_id, name_norm)
-
-                # optional search keywords (DB columns exist)
-                kw = ""
-                if lang_n == "nl":
-                    kw = (r.get("search_keywords_nl") or "")
-                else:
-                    kw = (r.get("search_keywords_en") or "")
-
-                # BUT: your SELECT above doesn't include search_keywords_* (kept light).
-                # If you want them, add them to SELECT and this will work.
-                # We'll still support tags.keywords for now:
-
-                kws = (tags.get("keywords") or "")
-                if isinstance(kws, str) and kws.strip():
-                    for part in kws.replace("\n", ",").split(","):
-                        _set_alias(norm_text(part), item_id, name_norm)
-
-                aliases = tags.get("aliases")
-                if isinstance(aliases, list):
-                    for a in aliases[:30]:
-                        _set_alias(norm_text(str(a)), item_id, name_norm)
-
-            # explicit alias table
-            alias_rows = await conn.fetch(
-                f"""
-                SELECT item_id, alias_text
-                FROM {self.schema}.menu_item_aliases
-                WHERE tenant_id = $1
-                """,
-                snap.tenant_id,
-            )
-
-            for ar in alias_rows:
-                iid = str(ar["item_id"])
-                if iid not in snap.items_by_id:
-                    continue
-                alias = norm_text(ar.get("alias_text") or "")
-                if not alias:
-                    continue
-                name_norm = norm_text(snap.items_by_id[iid].name)
-                _set_alias(alias, iid, name_norm)
-
-        self._cache[cache_key] = (now, snap)
+                kw = (r.get("search_keywords_en") or "")
+
+            # BUT: your SELECT above doesn't include search_keywords_* (kept light).
+            # If you want them, add them to SELECT and this will work.
+            # We'll still support tags.keywords for now (projected as tag_keywords):
+
+            kws = r["tag_keywords"] or ""
+            if kws.strip():
+                parts = kws.replace("\n", ",").split(",")
+                alias_raw.extend(parts)
+                alias_owner.extend([item] * len(parts))
+
+            aliases = r["tag_aliases"]
+            if isinstance(aliases, list):
+                for a in aliases[:30]:
+                    alias_raw.append(str(a))
+                    alias_owner.append(item)
+
+        # explicit alias table
+        for ar in alias_rows:
+            iid = str(ar["item_id"])
+            alias_item = items_by_id.get(iid)
+            if alias_item is None:
+                continue
+            alias_raw.append(ar.get("alias_text") or "")
+            alias_owner.append(alias_item)
+
+        # same order as before: rows (name, keywords, tag aliases), then the alias table
+        for alias_norm, owner in zip(map(norm_text, alias_raw), alias_owner):
+            if len(alias_norm) < 3:
+                continue
+            if alias_norm in _GENERIC_NAAN_ALIASES:
+                _set_generic_naan_alias(alias_norm, owner)  # rare: only the few generic naan keys
+            else:
+                alias_map[alias_norm] = owner.item_id
+
+        snap = MenuSnapshot(
+            tenant_id=str(tenant["tenant_id"]),
+            tenant_name=str(tenant["name"]),
+            default_language=str(tenant.get("default_language") or "english"),
+            items_by_id=items_by_id,
+            name_choices=tuple(name_choices),
+            display_names_lower=tuple(display_names_lower),
+            alias_map=MappingProxyType(alias_map),
+        )
+
+        self._neg_cache.pop(cache_key, None)
+        if generation == self._generation:
+            self._cache[cache_key] = (loaded_at, snap)
         return snap
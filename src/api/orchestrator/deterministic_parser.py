@@ -1,26 +1,41 @@
 from __future__ import annotations
 
+import re
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
+from ..text import norm_text
 from .parser_types import ParserResult, ParserStatus, ReasonCode
 
+# pyahocorasick is optional: without it alias hits come from one compiled regex.
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None  # type: ignore
+
 
 class DeterministicParser:
     """
     Sprint-1 deterministic parser:
-      - exact alias match (O(1) dict lookup)
+      - exact alias match (O(1) dict lookup) on the norm_text() form,
+        the same normalization MenuStore applies to alias keys
+      - else the longest alias occurring as whole words inside the utterance
+        (one linear scan; two different items at that length -> AMBIGUOUS)
       - no side effects
       - stable typed result
     """
 
     def __init__(self, alias_map: Dict[str, str]):
         self.alias_map = alias_map
+        # built on the first utterance that misses the exact lookup
+        self._automaton = None
+        self._pattern: Optional[re.Pattern] = None
+        self._built = False
 
     def parse(self, utterance: str) -> ParserResult:
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
 
-        norm = (utterance or "").strip().lower()
+        norm = self._norm(utterance)
         if not norm:
             return self._result(
                 status=ParserStatus.NO_MATCH,
@@ -38,6 +53,22 @@ class DeterministicParser:
                 start=start,
             )
 
+        entities = {self.alias_map[k] for k in self._longest_alias_hits(norm)}
+        if len(entities) == 1:
+            return self._result(
+                status=ParserStatus.MATCH,
+                reason=ReasonCode.CONTAINED_ALIAS_MATCH,
+                entity=entities.pop(),
+                start=start,
+            )
+        if entities:
+            return self._result(
+                status=ParserStatus.NO_MATCH,
+                reason=ReasonCode.AMBIGUOUS,
+                entity=None,
+                start=start,
+            )
+
         return self._result(
             status=ParserStatus.NO_MATCH,
             reason=ReasonCode.NO_ALIAS_FOUND,
@@ -45,19 +76,59 @@ class DeterministicParser:
             start=start,
         )
 
+    def _build(self) -> None:
+        self._built = True
+        keys = [k for k, v in self.alias_map.items() if k and v]
+        if not keys:
+            return
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for k in keys:
+                automaton.add_word(k, k)
+            automaton.make_automaton()
+            self._automaton = automaton
+            return
+        # Lookahead => one hit per start position; longest-first alternation => the
+        # longest alias starting there. Whole words only: norm is single-space separated.
+        alts = "|".join(map(re.escape, sorted(keys, key=lambda k: (-len(k), k))))
+        self._pattern = re.compile(rf"(?=(?<!\S)({alts})(?!\S))")
+
+    def _longest_alias_hits(self, norm: str) -> List[str]:
+        """Aliases of maximal length found in norm as whole words."""
+        if not self._built:
+            self._build()
+        hits: List[str] = []
+        if self._automaton is not None:
+            n = len(norm)
+            for end, key in self._automaton.iter(norm):
+                begin = end - len(key) + 1
+                if (begin == 0 or norm[begin - 1] == " ") and (end + 1 == n or norm[end + 1] == " "):
+                    hits.append(key)
+        elif self._pattern is not None:
+            hits = [m.group(1) for m in self._pattern.finditer(norm)]
+        if not hits:
+            return hits
+        longest = max(map(len, hits))
+        return [k for k in hits if len(k) == longest]
+
+    @staticmethod
+    def _norm(utterance: str) -> str:
+        # "Two garlic naan." -> "two garlic naan" (STT punctuation must not block a match)
+        return norm_text(utterance)
+
     @staticmethod
     def _result(
         *,
         status: ParserStatus,
         reason: ReasonCode,
         entity: Optional[str],
-        start: float,
+        start: int,
     ) -> ParserResult:
-        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        # integer ns clock; no rounding here, formatting is the consumer's job
         return ParserResult(
             status=status,
             reason=reason,
             matched_entity=entity,
-            execution_time_ms=round(elapsed_ms, 3),
+            execution_time_ms=(time.perf_counter_ns() - start) / 1e6,
         )
 
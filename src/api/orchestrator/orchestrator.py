@@ -14,7 +14,7 @@ class OrchestratorRoute(str, Enum):
     AGENT = "agent"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrchestratorDecision:
     route: OrchestratorRoute
     parser_result: ParserResult
@@ -12,6 +12,7 @@ class ParserStatus(str, Enum):
 
 class ReasonCode(str, Enum):
     EXACT_ALIAS_MATCH = "exact_alias_match"
+    CONTAINED_ALIAS_MATCH = "contained_alias_match"
     NO_ALIAS_FOUND = "no_alias_found"
     AMBIGUOUS = "ambiguous"
     EMPTY_INPUT = "empty_input"
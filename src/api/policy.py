@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Optional, Sequence, Tuple
 
+from .intent import MarkerScanner
+
 
 _NL_FOLLOWUP_RX = re.compile(
     r"(?i)\b("
@@ -94,29 +97,59 @@ _MORE_MARKERS_EN = (
 )
 
 
-@dataclass
+# Follow-up and "more" markers for both languages in one scan (Aho-Corasick when available);
+# matched against the lowercased text, substring semantics as before.
+_SCANNER = MarkerScanner({
+    "nl_followup": _FOLLOWUP_MARKERS_NL,
+    "en_followup": _FOLLOWUP_MARKERS_EN,
+    "nl_more": _MORE_MARKERS_NL,
+    "en_more": _MORE_MARKERS_EN,
+})
+_BITS = _SCANNER.bits
+
+
+@dataclass(frozen=True, slots=True)
 class OrderItem:
     name: str
     qty: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
-    items: List[OrderItem] = field(default_factory=list)
+    # Immutable snapshot (tuple of frozen items); add() swaps in a new tuple. The caches
+    # below remember which tuple they were built from, so no mutation can make them stale.
+    items: Tuple[OrderItem, ...] = ()
+    # items[i].name.lower() for the tuple in _names_src
+    _names_lc: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _names_src: Optional[Tuple[OrderItem, ...]] = field(default=None, init=False, repr=False, compare=False)
+    # cart_summary() result for the tuple in _summary_src
+    _summary: str = field(default="", init=False, repr=False, compare=False)
+    _summary_src: Optional[Tuple[OrderItem, ...]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.items = tuple(self.items)  # never share the caller's list
 
     def add(self, name: str, qty: int = 1) -> None:
         name_n = (name or "").strip()
         if not name_n:
             return
         q = int(qty) if qty is not None else 1
-        for it in self.items:
-            if it.name.lower() == name_n.lower():
-                it.qty += q
-                return
-        self.items.append(OrderItem(name=name_n, qty=q))
-
-
-@dataclass
+        items = self.items
+        if self._names_src is not items:
+            self._names_lc = [it.name.lower() for it in items]
+        name_lc = name_n.lower()
+        try:
+            i = self._names_lc.index(name_lc)
+        except ValueError:
+            items += (OrderItem(name=name_n, qty=q),)
+            self._names_lc.append(name_lc)
+        else:
+            it = items[i]
+            items = items[:i] + (OrderItem(name=it.name, qty=it.qty + q),) + items[i + 1:]
+        self.items = self._names_src = items
+
+
+@dataclass(slots=True)
 class SessionPolicyState:
     lang: str = "en"
     order: Order = field(default_factory=Order)
@@ -125,10 +158,21 @@ class SessionPolicyState:
 
 
 def cart_summary(order: Order) -> str:
-    if not order.items:
-        return "Empty"
-    parts = [f"{it.qty}x {it.name}" for it in order.items if it.qty > 0 and it.name]
-    return ", ".join(parts) if parts else "Empty"
+    items = order.items
+    if order._summary_src is not items:
+        order._summary = ", ".join(f"{it.qty}x {it.name}" for it in items if it.qty > 0 and it.name) or "Empty"
+        order._summary_src = items
+    return order._summary
+
+
+# (lang, verbose) -> question; every language other than nl gets English
+_NAAN_QUESTION = {
+    # minimal, mature flow
+    ("nl", True): "Zeker. Wil je gewone naan of garlic naan?",
+    ("nl", False): "Gewone naan of garlic naan?",
+    ("en", True): "Certainly. Would you like plain naan or garlic naan?",
+    ("en", False): "Plain naan or garlic naan?",
+}
 
 
 def nan_variant_question(lang: str, verbose: bool = True) -> str:
@@ -136,17 +180,18 @@ def nan_variant_question(lang: str, verbose: bool = True) -> str:
     Default to Optima-style minimal choice.
     If user explicitly asks for options, controller can call its dynamic list-mode.
     """
-    lang_n = (lang or "en").lower()
+    return _NAAN_QUESTION[("nl" if (lang or "en").lower() == "nl" else "en", bool(verbose))]
 
-    if lang_n == "nl":
-        if verbose:
-            # minimal, mature flow
-            return "Zeker. Wil je gewone naan of garlic naan?"
-        return "Gewone naan of garlic naan?"
 
-    if verbose:
-        return "Certainly. Would you like plain naan or garlic naan?"
-    return "Plain naan or garlic naan?"
+# (lang, hint) -> follow-up; "" is the generic prompt for any other hint
+_POST_CART_FOLLOWUP = {
+    ("nl", "main"): "Wil je daar rijst of naan bij?",
+    ("nl", "naan"): "Wil je er nog iets bij, bijvoorbeeld rijst, dahl, of een samosa?",
+    ("nl", ""): "Wil je nog iets toevoegen of wijzigen?",
+    ("en", "main"): "Would you like rice or naan with that?",
+    ("en", "naan"): "Would you like anything else, for example rice, dal, or a samosa?",
+    ("en", ""): "Anything else you'd like to add?",
+}
 
 
 def post_cart_followup(lang: str, summary: str, last_added_hint: Optional[str] = None) -> str:
@@ -159,21 +204,9 @@ def post_cart_followup(lang: str, summary: str, last_added_hint: Optional[str] =
       - "naan": user added naan -> suggest sides/starters
       - None: generic
     """
-    lang_n = (lang or "en").lower()
+    lang_k = "nl" if (lang or "en").lower() == "nl" else "en"
     hint = (last_added_hint or "").strip().lower()
-
-    if lang_n == "nl":
-        if hint == "main":
-            return "Wil je daar rijst of naan bij?"
-        if hint == "naan":
-            return "Wil je er nog iets bij, bijvoorbeeld rijst, dahl, of een samosa?"
-        return "Wil je nog iets toevoegen of wijzigen?"
-
-    if hint == "main":
-        return "Would you like rice or naan with that?"
-    if hint == "naan":
-        return "Would you like anything else, for example rice, dal, or a samosa?"
-    return "Anything else you'd like to add?"
+    return _POST_CART_FOLLOWUP.get((lang_k, hint)) or _POST_CART_FOLLOWUP[(lang_k, "")]
 
 
 def system_guard_for_llm(state: SessionPolicyState) -> str:
@@ -184,9 +217,12 @@ def system_guard_for_llm(state: SessionPolicyState) -> str:
     New rule: confirm briefly; only repeat the full cart when user asks,
     or when there's ambiguity that needs confirmation.
     """
-    summary = cart_summary(state.order)
-    lang = (state.lang or "en").lower()
+    return _system_guard((state.lang or "en").lower(), cart_summary(state.order))
+
 
+@lru_cache(maxsize=64)
+def _system_guard(lang: str, summary: str) -> str:
+    # Pure in (lang, cart summary); the cart is unchanged on most LLM turns.
     if lang == "nl":
         return (
             "JE BENT EEN RESTAURANT-OBER.\n"
@@ -222,20 +258,18 @@ def is_followup_recommendation(text: str, lang: str) -> bool:
     if lang_n == "nl":
         if _NL_FOLLOWUP_RX.search(t):
             return True
-        return any(m in t_lc for m in _FOLLOWUP_MARKERS_NL)
+        return bool(_SCANNER.scan(t_lc) & _BITS["nl_followup"])
 
     if _EN_FOLLOWUP_RX.search(t):
         return True
-    return any(m in t_lc for m in _FOLLOWUP_MARKERS_EN)
+    return bool(_SCANNER.scan(t_lc) & _BITS["en_followup"])
 
 
 def is_more_request(text: str, lang: str) -> bool:
     t = (text or "").strip().lower()
     if not t:
         return False
-    if (lang or "en").lower() == "nl":
-        return any(m in t for m in _MORE_MARKERS_NL)
-    return any(m in t for m in _MORE_MARKERS_EN)
+    return bool(_SCANNER.scan(t) & _BITS["nl_more" if (lang or "en").lower() == "nl" else "en_more"])
 
 
 def set_last_category(state: SessionPolicyState, category: str, items: Sequence[str]) -> None:
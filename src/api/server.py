@@ -75,6 +75,7 @@ async def lifespan(app: FastAPI):
                 db_url,
                 ttl_seconds=settings.MENU_TTL_SECONDS,
                 schema=settings.MENU_SCHEMA,
+                max_stale_seconds=settings.MENU_MAX_STALE_SECONDS,
             )
             await menu_store.start()
             logger.info("MenuStore started")
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import re
 import time
 from dataclasses import dataclass, field
 from enum import Enum
@@ -13,6 +14,7 @@ from fastapi import WebSocket
 
 from .intent import (
     detect_language_intent,
+    make_utterance,
     norm_simple,
     detect_generic_nan_request,
     detect_explicit_remove_intent,
@@ -28,10 +30,11 @@ from .telemetry.emitter import TelemetryEmitter, TelemetryContext
 
 # Orchestrator is optional; never crash if it is unavailable.
 try:
-    from .orchestrator import CognitiveOrchestrator, OrchestratorRoute
+    from .orchestrator import CognitiveOrchestrator, OrchestratorRoute, ReasonCode
 except Exception:
     CognitiveOrchestrator = None  # type: ignore
     OrchestratorRoute = None      # type: ignore
+    ReasonCode = None             # type: ignore
 
 logger = logging.getLogger("taj-agent")
 
@@ -166,14 +169,18 @@ QTY_MAP_NL = {"een": 1, "één": 1, "1": 1, "twee": 2, "2": 2, "drie": 3, "3": 3
 QTY_MAP_EN = {"one": 1, "1": 1, "two": 2, "2": 2, "three": 3, "3": 3, "four": 4, "4": 4}
 
 
+# First whole token that is a quantity word, in one regex scan (norm_simple output is single-spaced)
+_QTY_RX_NL = re.compile(r"(?<!\S)(" + "|".join(map(re.escape, QTY_MAP_NL)) + r")(?!\S)")
+_QTY_RX_EN = re.compile(r"(?<!\S)(" + "|".join(map(re.escape, QTY_MAP_EN)) + r")(?!\S)")
+
+
 def _extract_qty_first(text: str, lang: str) -> Optional[int]:
-    t = norm_simple(text)
-    toks = t.split()
-    m = QTY_MAP_NL if lang == "nl" else QTY_MAP_EN
-    for tok in toks:
-        if tok in m:
-            return int(m[tok])
-    return None
+    if lang == "nl":
+        rx, m = _QTY_RX_NL, QTY_MAP_NL
+    else:
+        rx, m = _QTY_RX_EN, QTY_MAP_EN
+    hit = rx.search(norm_simple(text))
+    return m[hit.group(1)] if hit else None
 
 
 def _safe_json_loads(s: str) -> Optional[Dict[str, Any]]:
@@ -259,7 +266,7 @@ def _policy_guard_append(state: SessionState, system_text: str) -> str:
             pass
 
         guard = system_guard_for_llm(ps)
-        return (system_text or "").rstrip() + "\n\n" + guard.strip()
+        return "\n\n".join(((system_text or "").rstrip(), guard.strip()))
     except Exception:
         return system_text
 
@@ -268,12 +275,13 @@ def build_llm_messages(state: SessionState, user_text: str, menu_context: str) -
     cart = state.order.summary(state.menu) if state.menu else ""
     cart_str = cart if cart else "Empty"
 
-    sys = (
-        LLM_SYSTEM_BASE
-        + f"\n\nlang={state.lang}"
-        + f"\nCURRENT_CART: [{cart_str}]"
-        + f"\nMENU_CONTEXT:\n{menu_context}"
-    )
+    # one join sized to the final prompt instead of chained concatenation
+    sys = "".join((
+        LLM_SYSTEM_BASE,
+        f"\n\nlang={state.lang}",
+        f"\nCURRENT_CART: [{cart_str}]",
+        f"\nMENU_CONTEXT:\n{menu_context}",
+    ))
     sys = _policy_guard_append(state, sys)
     return [{"role": "system", "content": sys}, {"role": "user", "content": user_text}]
 
@@ -635,6 +643,19 @@ class SessionController:
                 out[alias] = iid
         return out
 
+    def _orchestrator_for(self, menu: MenuSnapshot) -> Any:
+        """Orchestrator for this snapshot, shared by every session on it (built once)."""
+        tenant_ref = self.state.tenant_ref
+
+        def build(m: MenuSnapshot) -> Any:
+            alias_map: Dict[str, str] = dict(m.alias_map or {})
+            if tenant_ref == "taj_mahal":
+                alias_map.update(self._taj_overlay_alias_map(m))
+            # The orchestrator and its parser are stateless, so sessions can share it
+            return CognitiveOrchestrator(alias_map=alias_map)
+
+        return menu.derived(("orchestrator", tenant_ref), build)
+
     def _maybe_orchestrator_match_item(self, menu: MenuSnapshot, transcript: str, qty: int) -> Optional[str]:
         """
         Optional RC3: deterministic parser BEFORE any LLM.
@@ -650,15 +671,15 @@ class SessionController:
         if len((transcript or "").strip().split()) > 3:
             return None
 
-        alias_map: Dict[str, str] = dict(menu.alias_map or {})
-        if self.state.tenant_ref == "taj_mahal":
-            alias_map.update(self._taj_overlay_alias_map(menu))
-
-        orch = CognitiveOrchestrator(alias_map=alias_map)
+        orch = self._orchestrator_for(menu)
         decision = orch.decide(transcript)
 
         if decision.route != OrchestratorRoute.DETERMINISTIC:
             return None
+        # Only a whole-utterance alias: a contained hit ("two butter chicken",
+        # "geen garlic naan") must go through parse_add_item / negation handling.
+        if decision.parser_result.reason != ReasonCode.EXACT_ALIAS_MATCH:
+            return None
 
         item_id = decision.parser_result.matched_entity
         if not isinstance(item_id, str) or not item_id:
@@ -667,6 +688,18 @@ class SessionController:
         # Do not mutate cart here; caller decides to avoid double-add.
         return item_id
 
+    def _deterministic_adds(self, menu: MenuSnapshot, transcript: str, qty: int) -> List[Tuple[str, int]]:
+        """
+        (item_id, qty) pairs to add for this utterance.
+        RC3: an exact orchestrator alias hit is used as-is (prevents double-add);
+        everything else goes through parse_add_item.
+        """
+        q = max(1, int(qty or 1))
+        orch_item_id = self._maybe_orchestrator_match_item(menu, transcript, q)
+        if orch_item_id:
+            return [(orch_item_id, q)]
+        return parse_add_item(menu, transcript, qty=q)
+
     def _maybe_orchestrator_apply_qty_update(self, menu: MenuSnapshot, transcript: str) -> Optional[Tuple[str, int]]:
         """
         Deterministic qty/update intent BEFORE LLM.
@@ -683,11 +716,7 @@ class SessionController:
         if not menu:
             return None
 
-        alias_map: Dict[str, str] = dict(menu.alias_map or {})
-        if self.state.tenant_ref == "taj_mahal":
-            alias_map.update(self._taj_overlay_alias_map(menu))
-
-        orch = CognitiveOrchestrator(alias_map=alias_map)
+        orch = self._orchestrator_for(menu)
         decision = orch.decide(transcript)
         if decision.route != OrchestratorRoute.DETERMINISTIC:
             return None
@@ -959,7 +988,9 @@ class SessionController:
 
             logger.info("STT: %s", transcript)
             await self.send_user_text(ws, transcript)
-            tnorm = " " + norm_simple(transcript) + " "
+            # normalized once per turn; shared by the detectors below
+            utt = make_utterance(transcript)
+            tnorm = " " + utt.norm + " "
 
             # ==========================================================
             # 1) Global intent guard (Intent-First)
@@ -1002,7 +1033,7 @@ class SessionController:
 
             allow_auto = not (st.tenant_ref == "taj_mahal" and st.lang != "nl")
             _ = detect_language_intent(
-                transcript,
+                utt,
                 phase=st.phase,
                 current_lang=st.lang,
                 allow_auto_detect=allow_auto,
@@ -1059,7 +1090,6 @@ class SessionController:
                 return
 
             # Treat quantity-bearing utterances as ordering, even if global intent missed it.
-            tnorm = " " + norm_simple(transcript) + " "
             looks_like_order_payload = any(
                 x in tnorm
                 for x in (
@@ -1147,7 +1177,7 @@ class SessionController:
 
             if st.menu:
                 if st.tenant_ref == "taj_mahal":
-                    tok = norm_simple(transcript).strip()
+                    tok = utt.norm
                     if tok in TAJ_EXTRA_ALIASES and TAJ_EXTRA_ALIASES[tok] != "__GLOBAL_ORDER__":
                         target_name = TAJ_EXTRA_ALIASES[tok].lower()
                         for _n, iid in st.menu.name_choices:
@@ -1158,11 +1188,9 @@ class SessionController:
                                 added_ids.append(iid)
                                 break
 
-                # RC3: prevent double-add when orchestrator already matched
-                orch_item_id = self._maybe_orchestrator_match_item(st.menu, transcript, int(effective_qty or 1))
-                adds = [] if orch_item_id else parse_add_item(st.menu, transcript, qty=effective_qty)
+                adds = self._deterministic_adds(st.menu, transcript, effective_qty)
 
-                mentions_nan = (" naan " in (" " + norm_simple(transcript) + " ")) or detect_generic_nan_request(transcript)
+                mentions_nan = (" naan " in tnorm) or detect_generic_nan_request(utt)
                 variant = _extract_nan_variant_keyword_scoped(transcript)
                 has_variant = bool(variant)
 
@@ -1188,7 +1216,7 @@ class SessionController:
                     st.nan_prompt_count = 0
 
                     await self.clear_thinking(ws)
-                    await self._speak(ws, self._naan_optima_prompt(list_mode="short", with_main="Butter Chicken" if "butter chicken" in norm_simple(transcript) else None))
+                    await self._speak(ws, self._naan_optima_prompt(list_mode="short", with_main="Butter Chicken" if "butter chicken" in utt.norm else None))
                     return
 
                 if mentions_nan and has_variant:
@@ -1226,7 +1254,7 @@ class SessionController:
             # RC3: explicit "done/checkout" intent must bypass LLM and start fulfillment flow
             # (Prevents LLM from inventing irrelevant steps like "spice level".)
             if st.menu:
-                t_norm = " " + norm_simple(transcript) + " "
+                t_norm = " " + utt.norm + " "
                 checkout_intent = any(k in t_norm for k in [
                     " that's all ", " that is all ", " thats all ", " that's it ", " thats it ",
                     " nothing else ", " no more ", " done ", " finish ", " finalize ",
@@ -1279,7 +1307,7 @@ class SessionController:
             out = await llm_turn(self.oa, st, transcript, menu_context)
             reply = (out.get("reply") or "").strip()
 
-            if reply and not detect_explicit_remove_intent(transcript, st.lang):
+            if reply and not detect_explicit_remove_intent(utt, st.lang):
                 if any(x in reply.lower() for x in ["remove", "cancel", "take off", "delete", "verwijder", "haal weg", "annuleer", "schrap"]):
                     reply = "Sorry — did you want to add something, or change your order?" if st.lang != "nl" else "Sorry — wil je iets toevoegen, of je bestelling wijzigen?"
 
@@ -54,6 +54,8 @@ TENANT_TTS_INSTRUCTIONS_ENABLED = _get_bool("TENANT_TTS_INSTRUCTIONS_ENABLED", "
 # --------------------------------------------------
 DATABASE_URL = _get_str("DATABASE_URL", "")
 MENU_TTL_SECONDS = _get_int("MENU_TTL_SECONDS", "180")
+# Stale snapshots are served (and refreshed in the background) up to this age
+MENU_MAX_STALE_SECONDS = _get_int("MENU_MAX_STALE_SECONDS", "900")
 MENU_SCHEMA = _get_str("MENU_SCHEMA", "public")
 
 # --------------------------------------------------
@@ -79,7 +79,8 @@ InsertFn = Callable[[TelemetryEvent], Awaitable[None]]
 class TelemetryEmitter:
     """
     Fire-and-forget emitter.
-    Never blocks runtime. Best-effort only.
+    Never blocks runtime. Best-effort only: emit_* only queue a loop callback;
+    redaction and the DB insert happen after the caller has moved on.
 
     NOTE: SessionController currently instantiates TelemetryEmitter() with no args.
     So we provide a default asyncpg-backed insert_fn when none is passed.
@@ -121,11 +122,26 @@ class TelemetryEmitter:
             logger.debug("telemetry: no running loop, skip emit")
             return
 
+        # Redaction + event building run on the next loop iteration, after the
+        # caller has returned its decision; only the timestamp is taken now.
+        try:
+            loop.call_soon(self._schedule_no_match, loop, datetime.now(timezone.utc), ctx, utterance, parser_result)
+        except Exception:
+            logger.debug("telemetry: failed to schedule emit", exc_info=True)
+
+    def _schedule_no_match(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        ts: datetime,
+        ctx: TelemetryContext,
+        utterance: str,
+        parser_result,
+    ) -> None:
         try:
             utter_red, pii_redacted, truncated = redact_pii_mvp(utterance)
 
             evt = TelemetryEvent(
-                ts=datetime.now(timezone.utc),
+                ts=ts,
                 session_id=str(getattr(ctx, "session_id", "") or "unknown"),
                 tenant_id=str(getattr(ctx, "tenant_id", "") or "unknown"),
                 domain=str(getattr(ctx, "domain", "") or "unknown"),
@@ -159,11 +175,37 @@ class TelemetryEmitter:
         except RuntimeError:
             return
 
+        try:
+            loop.call_soon(
+                self._schedule_reason_only,
+                loop,
+                datetime.now(timezone.utc),
+                ctx,
+                utterance,
+                parser_status,
+                parser_reason,
+                execution_time_ms,
+                confidence,
+            )
+        except Exception:
+            logger.debug("telemetry: failed to schedule emit_reason_only", exc_info=True)
+
+    def _schedule_reason_only(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        ts: datetime,
+        ctx: TelemetryContext,
+        utterance: str,
+        parser_status: str,
+        parser_reason: str,
+        execution_time_ms: float,
+        confidence: float,
+    ) -> None:
         try:
             utter_red, pii_redacted, truncated = redact_pii_mvp(utterance)
 
             evt = TelemetryEvent(
-                ts=datetime.now(timezone.utc),
+                ts=ts,
                 session_id=ctx.session_id,
                 tenant_id=ctx.tenant_id,
                 domain=ctx.domain,
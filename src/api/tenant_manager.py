@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from .intent import norm_simple
+
 logger = logging.getLogger("taj-agent")
 
 try:
@@ -40,16 +42,16 @@ def _read_json(p: Path) -> Dict[str, Any]:
     return json.loads(p.read_text(encoding="utf-8"))
 
 
-def norm_simple(s: str) -> str:
-    """
-    Lowercase + remove punctuation => spaces + collapse whitespace.
-    Matches your baseline intent-ish normalization.
-    """
-    s = (s or "").lower()
-    cleaned = []
-    for ch in s:
-        cleaned.append(ch if (ch.isalnum() or ch.isspace()) else " ")
-    return " ".join("".join(cleaned).split()).strip()
+# naam -> naan gate inputs; fixed sets, built once
+_NAAM_GATE_QTY_WORDS = frozenset({"een", "twee", "drie", "vier", "vijf", "one", "two", "three", "four", "five"})
+_NAAM_GATE_INTENT_MARKERS = (
+    "graag naam",
+    "naam erbij",
+    "naam er bij",
+    "ik wil naam",
+    "wil graag naam",
+    "ik wilde graag naam",
+)
 
 
 def _flags_from_list(flags: Optional[List[str]]) -> int:
@@ -309,19 +311,8 @@ class TenantManager:
         if not norm:
             return text
 
-        qty_words = {"een", "twee", "drie", "vier", "vijf", "one", "two", "three", "four", "five"}
-        toks = set(norm.split())
-        has_qty = bool(toks & qty_words)
-
-        intent_markers = (
-            "graag naam",
-            "naam erbij",
-            "naam er bij",
-            "ik wil naam",
-            "wil graag naam",
-            "ik wilde graag naam",
-        )
-        has_intent = any(m in norm for m in intent_markers)
+        has_qty = not _NAAM_GATE_QTY_WORDS.isdisjoint(norm.split())
+        has_intent = any(m in norm for m in _NAAM_GATE_INTENT_MARKERS)
 
         if has_qty or has_intent:
             out = re.sub(r"\bnaam\b", "naan", text, flags=re.IGNORECASE)
@@ -5,6 +5,11 @@ import re
 
 _WS_RX = re.compile(r"\s+")
 _KEEP_RX = re.compile(r"[^a-z0-9\s]+")
+# ASCII fast path: everything _KEEP_RX would blank out, as one translate table
+_ASCII_BLANK = str.maketrans({
+    chr(c): " " for c in range(128)
+    if not (chr(c).isdigit() or "a" <= chr(c) <= "z" or chr(c).isspace())
+})
 
 def norm_text(s: str) -> str:
     """
@@ -13,7 +18,10 @@ def norm_text(s: str) -> str:
     - removes punctuation
     - collapses whitespace
     """
-    t = (s or "").strip().lower()
-    t = _KEEP_RX.sub(" ", t)
+    t = (s or "").lower()
+    if t.isascii():
+        # one C-level pass instead of two regex substitutions
+        return " ".join(t.translate(_ASCII_BLANK).split())
+    t = _KEEP_RX.sub(" ", t.strip())
     t = _WS_RX.sub(" ", t).strip()
     return t
@@ -3,6 +3,7 @@ import asyncpg
 from typing import Optional, List, Dict
 import logging
 import json
+import weakref
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +11,22 @@ class Database:
     def __init__(self):
         self.pool: Optional[asyncpg.Pool] = None
 
+        # Pool sizing (server defaults); one-shot scripts shrink via configure_pool()
+        # Neon suspends idle compute and drops its connections: keep no idle floor and
+        # recycle connections well before that, instead of finding them dead on first use.
+        self.min_size = 0
+        self.max_size = 10
+        self.max_inactive_connection_lifetime = 60.0
+        self.max_queries = 50000
+        self.connect_timeout = 45.0  # covers a Neon cold start
+
+        # Hot-path statements: name -> SQL (register_statement), prepared lazily on first
+        # use per connection; keyed by the underlying connection, dropped when it closes.
+        self._statements: Dict[str, str] = {}
+        self._prepared: "weakref.WeakKeyDictionary[asyncpg.Connection, Dict[str, asyncpg.prepared_stmt.PreparedStatement]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
         # Prefer env var; fallback only if not set.
         # NOTE: .env is loaded by src/api/server.py at process start (load_dotenv()).
         self.db_url = os.getenv("DATABASE_URL") or ""
@@ -17,6 +34,37 @@ class Database:
             # Keep a safe error message (do NOT print secrets)
             logger.warning("DATABASE_URL is not set in environment; Database.connect() will fail.")
 
+    def configure_pool(
+        self,
+        min_size: int,
+        max_size: int,
+        max_inactive_connection_lifetime: float = 60.0,
+    ) -> None:
+        """Set pool sizing; must be called before connect()."""
+        if self.pool:
+            raise RuntimeError("configure_pool() must be called before connect()")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_inactive_connection_lifetime = max_inactive_connection_lifetime
+
+    def register_statement(self, name: str, sql: str) -> None:
+        """Register SQL to prepare once per connection; fetch it with prepared()."""
+        self._statements[name] = sql
+
+    async def prepared(self, con: asyncpg.Connection, name: str) -> asyncpg.prepared_stmt.PreparedStatement:
+        """Prepared statement `name` on this connection, prepared on its first use there."""
+        # pool.acquire() hands out a fresh proxy each time; cache on the real connection
+        raw = getattr(con, "_con", None) or con
+        stmts = self._prepared.get(raw)
+        if stmts is None:
+            stmts = self._prepared[raw] = {}
+            # statements reference their connection, so drop the entry explicitly on close
+            raw.add_termination_listener(lambda c: self._prepared.pop(c, None))
+        stmt = stmts.get(name)
+        if stmt is None:
+            stmt = stmts[name] = await con.prepare(self._statements[name])
+        return stmt
+
     async def connect(self):
         """Initialize connection pool"""
         if self.pool:
@@ -30,11 +78,26 @@ class Database:
 
         self.pool = await asyncpg.create_pool(
             self.db_url,
-            min_size=2,
-            max_size=10
+            min_size=self.min_size,
+            max_size=self.max_size,
+            max_inactive_connection_lifetime=self.max_inactive_connection_lifetime,
+            max_queries=self.max_queries,
+            timeout=self.connect_timeout,
         )
         logger.info("✅ Database connected to Neon")
 
+    async def single_connect(self) -> asyncpg.Connection:
+        """Open one standalone connection (no pool) for one-shot admin/verify scripts.
+
+        Caller owns the connection and must `await con.close()`.
+        """
+        if not self.db_url:
+            raise RuntimeError(
+                "DATABASE_URL is empty. "
+                "Load .env (e.g. via load_dotenv()) or export DATABASE_URL in your shell."
+            )
+        return await asyncpg.connect(self.db_url, timeout=self.connect_timeout)
+
     async def close(self):
         if self.pool:
             await self.pool.close()
@@ -49,7 +112,7 @@ class Database:
         async with self.pool.acquire() as conn:
             if category_id:
                 query = """
-                    SELECT item_id, name_en, description_en, price_delivery,
+                    SELECT item_id, name_en, description_en, price_delivery::float8 AS price_delivery,
                            category_id, customizable_spice
                     FROM menu_items
                     WHERE is_available = true AND category_id = $1
@@ -58,7 +121,7 @@ class Database:
                 rows = await conn.fetch(query, category_id)
             else:
                 query = """
-                    SELECT item_id, name_en, description_en, price_delivery,
+                    SELECT item_id, name_en, description_en, price_delivery::float8 AS price_delivery,
                            category_id, customizable_spice
                     FROM menu_items
                     WHERE is_available = true
@@ -75,7 +138,7 @@ class Database:
 
         async with self.pool.acquire() as conn:
             row = await conn.fetchrow("""
-                SELECT item_id, name_en, description_en, price_delivery,
+                SELECT item_id, name_en, description_en, price_delivery::float8 AS price_delivery,
                        category_id, customizable_spice,
                        is_vegetarian, is_vegan, contains_nuts, contains_dairy
                 FROM menu_items
@@ -158,13 +221,13 @@ class Database:
 
         async with self.pool.acquire() as conn:
             item = await conn.fetchrow("""
-                SELECT price_delivery FROM menu_items WHERE item_id = $1
+                SELECT price_delivery::float8 AS price_delivery FROM menu_items WHERE item_id = $1
             """, item_id)
 
             if not item:
                 raise ValueError(f"Item {item_id} not found")
 
-            price = float(item['price_delivery'])
+            price = item['price_delivery']
 
             customizations = {}
             if spice_level:
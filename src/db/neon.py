@@ -12,18 +12,42 @@ class NeonDB:
         if not self.dsn:
             raise ValueError("DATABASE_URL missing")
         self.pool: Optional[asyncpg.Pool] = None
+        self.min_size = 0
+        self.max_size = 5
+        self.max_inactive_connection_lifetime = 60.0
+        self.max_queries = 50000
+        self.connect_timeout = 45.0
+
+    def configure_pool(
+        self,
+        min_size: int,
+        max_size: int,
+        max_inactive_connection_lifetime: float = 60.0,
+    ) -> None:
+        if self.pool:
+            raise RuntimeError("configure_pool() must be called before connect()")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_inactive_connection_lifetime = max_inactive_connection_lifetime
 
     async def connect(self) -> None:
         if self.pool:
             return
         self.pool = await asyncpg.create_pool(
             dsn=self.dsn,
-            min_size=1,
-            max_size=5,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            max_inactive_connection_lifetime=self.max_inactive_connection_lifetime,
+            max_queries=self.max_queries,
+            timeout=self.connect_timeout,
             command_timeout=30,
         )
         logger.info("✅ Neon pool connected")
 
+    async def single_connect(self) -> asyncpg.Connection:
+        # One-shot scripts: single connection, no pool. Caller closes it.
+        return await asyncpg.connect(dsn=self.dsn, timeout=self.connect_timeout, command_timeout=30)
+
     async def close(self) -> None:
         if self.pool:
             await self.pool.close()
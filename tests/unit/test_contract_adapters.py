@@ -0,0 +1,45 @@
+from src.agent import contract_adapters
+from src.agent.contract_adapters import make_kitchen_status, make_menu
+
+
+def test_batch_shares_one_timestamp():
+    with contract_adapters.batch() as ts:
+        menu = make_menu("t1", items=[])
+        status = make_kitchen_status("t1", wait_time_min=10, capacity_status="normal")
+    assert menu["updated_at"] == ts
+    assert status["updated_at"] == ts
+
+    # Outside the batch a fresh timestamp is produced again
+    assert contract_adapters._batch_now.get() is None
+
+
+def test_nested_batch_restores_outer_timestamp():
+    with contract_adapters.batch() as outer:
+        with contract_adapters.batch():
+            pass
+        assert make_menu("t1", items=[])["updated_at"] == outer
+    assert contract_adapters._batch_now.get() is None
+
+
+def test_make_menu_item_fields_and_availability():
+    menu = make_menu(
+        "t1",
+        items=[
+            {"item_id": "a1", "name_en": " Garlic Naan ", "price_delivery": "3.50", "category_id": 2},
+            {"item_id": "a2", "available": None, "availability": True},
+            {"item_id": "a3", "availability": 0},
+        ],
+        categories=[{"category_id": 2, "name_en": "Breads"}],
+        updated_at="2026-01-01T00:00:00+00:00",
+    )
+    a1, a2, a3 = menu["items"]
+    assert a1["name"] == "Garlic Naan"
+    assert a1["price"] == {"amount": 3.5, "currency": "EUR"}
+    assert a1["category"] == "Breads"
+    assert a1["available"] is True
+    assert a1["tags"] == [] and a1["allergens"] == []
+
+    # Explicit `available` wins even when falsy; name falls back to item_id
+    assert a2["available"] is False
+    assert a2["name"] == "a2"
+    assert a3["available"] is False
@@ -11,6 +11,13 @@ def test_exact_alias_match():
     assert result.execution_time_ms >= 0
 
 
+def test_alias_match_ignores_stt_punctuation():
+    parser = DeterministicParser(alias_map={"two garlic naan": "garlic_naan"})
+    result = parser.parse("  Two garlic-naan. ")
+    assert result.status == ParserStatus.MATCH
+    assert result.matched_entity == "garlic_naan"
+
+
 def test_no_alias_match():
     parser = DeterministicParser(alias_map={})
     result = parser.parse("what's the weather")
@@ -18,3 +25,22 @@ def test_no_alias_match():
     assert result.reason == ReasonCode.NO_ALIAS_FOUND
     assert result.matched_entity is None
 
+
+def test_alias_inside_longer_utterance_prefers_longest():
+    parser = DeterministicParser(alias_map={"naan": "plain_naan", "garlic naan": "garlic_naan"})
+    result = parser.parse("can I get a garlic naan please")
+    assert result.status == ParserStatus.MATCH
+    assert result.reason == ReasonCode.CONTAINED_ALIAS_MATCH
+    assert result.matched_entity == "garlic_naan"
+
+
+def test_alias_must_match_whole_words():
+    parser = DeterministicParser(alias_map={"nan": "plain_naan"})
+    assert parser.parse("banana lassi").status == ParserStatus.NO_MATCH
+
+
+def test_two_items_at_same_length_are_ambiguous():
+    parser = DeterministicParser(alias_map={"korma": "lamb_korma", "tikka": "chicken_tikka"})
+    result = parser.parse("korma or tikka")
+    assert result.status == ParserStatus.NO_MATCH
+    assert result.reason == ReasonCode.AMBIGUOUS
@@ -0,0 +1,47 @@
+from src.api.intent import (
+    MarkerScanner,
+    detect_category_request,
+    detect_explicit_remove_intent,
+    detect_generic_nan_request,
+    detect_negative_intent,
+    detect_language_intent,
+    detect_order_summary_intent,
+    make_utterance,
+)
+
+
+def test_marker_scanner_reports_overlapping_groups():
+    scanner = MarkerScanner({"neg": ("no",), "remove": ("no longer",), "more": ("more",)})
+    mask = scanner.scan("i no longer want that")
+    assert mask & scanner.bits["neg"]
+    assert mask & scanner.bits["remove"]
+    assert not mask & scanner.bits["more"]
+    assert scanner.scan("") == 0
+
+
+def test_detectors_use_substring_markers():
+    assert detect_order_summary_intent("What is my order?", "en")
+    assert detect_order_summary_intent("Wat heb ik besteld", "nl")
+    assert not detect_order_summary_intent("my order", "nl")
+    assert detect_negative_intent("No rice, thanks")
+    assert detect_explicit_remove_intent("haal weg de rijst", "nl")
+    assert not detect_explicit_remove_intent("add rice", "en")
+
+
+def test_generic_nan_and_category():
+    assert detect_generic_nan_request("one naan please")
+    assert not detect_generic_nan_request("one garlic naan")
+    assert detect_category_request("what lamb dishes do you have") == "lamb"
+    assert detect_category_request("paneer") == "vegetarian"
+    assert detect_category_request("hello there") is None
+
+
+def test_utterance_is_accepted_by_detectors():
+    u = make_utterance("  Switch to Nederlands, please! ")
+    assert u.norm == "switch to nederlands please"
+    assert u.tokens == ("switch", "to", "nederlands", "please")
+    assert "nederlands" in u.tokset
+    assert detect_language_intent(u, phase="chat", current_lang="en").target == "nl"
+    assert detect_language_intent(u.raw, phase="chat", current_lang="en") == detect_language_intent(
+        u, phase="chat", current_lang="en"
+    )
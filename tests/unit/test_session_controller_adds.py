@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("asyncpg")
+
+from src.api.menu_store import MenuSnapshot
+from src.api.session_controller import SessionController, SessionState
+
+
+def _controller() -> SessionController:
+    return SessionController(
+        state=SessionState(tenant_ref="test"),
+        tenant_manager=None,
+        menu_store=None,
+        oa=None,
+        tenant_rules_enabled=False,
+        tenant_stt_prompt_enabled=False,
+        tenant_tts_instructions_enabled=False,
+        choose_voice=None,
+        choose_tts_instructions=None,
+        enforce_output_language=None,
+        send_user_text=None,
+        send_agent_text=None,
+        send_thinking=None,
+        clear_thinking=None,
+        tts_end=None,
+    )
+
+
+def _menu() -> MenuSnapshot:
+    return MenuSnapshot(tenant_id="t", tenant_name="T", alias_map={"butter chicken": "bc"})
+
+
+def test_qty_with_alias_still_adds_to_cart():
+    ctrl = _controller()
+    st = ctrl.state
+    for item_id, qty in ctrl._deterministic_adds(_menu(), "two butter chicken", 2):
+        st.order.add(item_id, qty)
+    assert st.order.items == {"bc": 2}
+
+
+def test_exact_alias_adds_once():
+    ctrl = _controller()
+    assert ctrl._deterministic_adds(_menu(), "Butter chicken.", 1) == [("bc", 1)]
+
+
+def test_contained_alias_is_not_an_orchestrator_hit():
+    ctrl = _controller()
+    assert ctrl._maybe_orchestrator_match_item(_menu(), "geen butter chicken", 1) is None
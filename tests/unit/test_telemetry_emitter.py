@@ -0,0 +1,23 @@
+import asyncio
+
+from src.api.telemetry.emitter import TelemetryContext, TelemetryEmitter
+
+
+def test_emit_returns_before_insert_runs():
+    seen = []
+
+    async def insert(evt):
+        seen.append(evt)
+
+    async def main():
+        em = TelemetryEmitter(insert)
+        ctx = TelemetryContext(session_id="s", tenant_id="t", domain="restaurant")
+        em.emit_reason_only(ctx=ctx, utterance="mail test@example.com", parser_status="NO_MATCH", parser_reason="X")
+        assert seen == []
+        for _ in range(3):
+            await asyncio.sleep(0)
+        return seen
+
+    (evt,) = asyncio.run(main())
+    assert evt.parser_reason == "X"
+    assert "[REDACTED_EMAIL]" in evt.utterance_redacted
@@ -22,6 +22,8 @@ set +a
 
 HOST="${HOST:-127.0.0.1}"
 PORT="${PORT:-8000}"
+# uvloop ships with uvicorn[standard]; set UVICORN_LOOP=asyncio to fall back
+UVICORN_LOOP="${UVICORN_LOOP:-uvloop}"
 
 # -------------------------
 # Tenant / Phase flags (safe defaults)
@@ -53,6 +55,7 @@ fi
 
 echo "==[start_backend]=="
 echo "HOST=${HOST} PORT=${PORT}"
+echo "UVICORN_LOOP=${UVICORN_LOOP}"
 echo "TENANTS_DIR=${TENANTS_DIR}"
 echo "TENANT_STT_PROMPT_ENABLED=${TENANT_STT_PROMPT_ENABLED}"
 echo "TENANT_TTS_INSTRUCTIONS_ENABLED=${TENANT_TTS_INSTRUCTIONS_ENABLED}"
@@ -64,7 +67,7 @@ echo "OPENAI_AUDIO_FILENAME_HINT=${OPENAI_AUDIO_FILENAME_HINT:-}"
 echo "DATABASE_URL set: $([[ -n "${DATABASE_URL:-}" ]] && echo yes || echo no)"
 echo "Press CTRL+C to stop"
 
-exec uvicorn src.api.server:app --reload --host "${HOST}" --port "${PORT}"
+exec uvicorn src.api.server:app --reload --loop "${UVICORN_LOOP}" --host "${HOST}" --port "${PORT}"
 SH
 
 chmod +x scripts/start_backend.sh